@@ -1,17 +1,38 @@
-from dataclasses import dataclass
+from functools import cached_property
 import os
 from pathlib import Path
+import re
+
+
+# 파싱 결과 캐시: path -> (mtime, size, parsed)
+_ENV_CACHE: dict[Path, tuple[float, int, dict[str, str]]] = {}
+
+# KEY=VALUE 한 줄 매칭 (주석/빈 줄/`=` 없는 줄은 매칭되지 않음)
+_ENV_LINE_RE = re.compile(r"^[ \t\r]*([^#=\s][^=\n]*?)[ \t\r]*=[ \t\r]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+
+def _read_env_file(env_path: Path) -> dict[str, str]:
+    with open(env_path, "rb") as f:
+        text = f.read().decode("utf-8")
+    parsed: dict[str, str] = {}
+    for k, v in _ENV_LINE_RE.findall(text):
+        parsed.setdefault(k, v.strip('"').strip("'"))
+    return parsed
 
 
 def _parse_env_file(env_path: Path) -> None:
-    if not env_path.exists():
+    try:
+        st = env_path.stat()
+    except OSError:
         return
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        k, v = line.split("=", 1)
-        os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
+    cached = _ENV_CACHE.get(env_path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        parsed = cached[2]
+    else:
+        parsed = _read_env_file(env_path)
+        _ENV_CACHE[env_path] = (st.st_mtime, st.st_size, parsed)
+    for k, v in parsed.items():
+        os.environ.setdefault(k, v)
 
 
 def _load_local_env() -> None:
@@ -30,54 +51,124 @@ def _load_local_env() -> None:
 _load_local_env()
 
 
-@dataclass
 class Settings:
-    def __init__(self):
-        # 환경변수에서 설정값 로드
-        self._reload()
-    
-    def _reload(self):
-        """환경변수에서 설정값을 다시 로드합니다."""
-        self.database_url: str = os.getenv("DATABASE_URL", "postgresql://localhost:5432/stock_trader")
-        self.min_map_confidence: float = float(os.getenv("MIN_MAP_CONFIDENCE", "0.92"))
-        self.risk_penalty_cap: float = float(os.getenv("RISK_PENALTY_CAP", "30"))
-        self.telegram_bot_token: str = os.getenv("TELEGRAM_BOT_TOKEN", os.getenv("TelegramBotToken", ""))
-        self.telegram_chat_id: str = os.getenv("TELEGRAM_CHAT_ID", os.getenv("TelegramChatId", ""))
-
-        # 브로커 선택: paper | kis
-        self.broker: str = os.getenv("BROKER", "paper").lower()
-
-        # KIS (한국투자증권) 연동 설정
-        self.kis_app_key: str = os.getenv("KIS_APP_KEY", "")
-        self.kis_app_secret: str = os.getenv("KIS_APP_SECRET", "")
-        self.kis_account_no: str = os.getenv("KIS_ACCOUNT_NO", "")
-        self.kis_product_code: str = os.getenv("KIS_PRODUCT_CODE", "01")
-        self.kis_mode: str = os.getenv("KIS_MODE", "paper")
-        self.kis_base_url: str = os.getenv("KIS_BASE_URL", "")
-
-        # Demo behavior
-        self.enable_demo_auto_close: bool = os.getenv("ENABLE_DEMO_AUTO_CLOSE", "0").strip().lower() in {"1", "true", "yes", "on"}
-
-        # Scheduler
-        self.exit_cycle_interval_sec: int = int(os.getenv("EXIT_CYCLE_INTERVAL_SEC", "60"))
-
-        # Risk limits
-        self.risk_max_loss_per_trade: float = float(os.getenv("RISK_MAX_LOSS_PER_TRADE", "30000"))
-        self.risk_daily_loss_limit: float = float(os.getenv("RISK_DAILY_LOSS_LIMIT", "100000"))
-        self.risk_max_exposure_per_symbol: float = float(os.getenv("RISK_MAX_EXPOSURE_PER_SYMBOL", "300000"))
-        self.risk_max_concurrent_positions: int = int(os.getenv("RISK_MAX_CONCURRENT_POSITIONS", "3"))
-        self.risk_loss_streak_cooldown: int = int(os.getenv("RISK_LOSS_STREAK_COOLDOWN", "3"))
-        self.risk_cooldown_minutes: int = int(os.getenv("RISK_COOLDOWN_MINUTES", "60"))
-        self.risk_assumed_stop_loss_pct: float = float(os.getenv("RISK_ASSUMED_STOP_LOSS_PCT", "0.015"))
-        self.risk_target_position_value: float = float(os.getenv("RISK_TARGET_POSITION_VALUE", "100000"))
-
-        # News ingestion
-        self.news_mode: str = os.getenv("NEWS_MODE", "sample").lower()  # sample | rss
-        self.news_rss_url: str = os.getenv("NEWS_RSS_URL", "https://www.mk.co.kr/rss/30000001/")
-    
+    """환경변수 기반 설정.
+
+    각 항목은 처음 접근할 때 환경변수에서 읽고 이후에는 캐시된 값을 사용합니다.
+    """
+
+    @cached_property
+    def database_url(self) -> str:
+        return os.getenv("DATABASE_URL", "postgresql://localhost:5432/stock_trader")
+
+    @cached_property
+    def min_map_confidence(self) -> float:
+        return float(os.getenv("MIN_MAP_CONFIDENCE", "0.92"))
+
+    @cached_property
+    def risk_penalty_cap(self) -> float:
+        return float(os.getenv("RISK_PENALTY_CAP", "30"))
+
+    @cached_property
+    def telegram_bot_token(self) -> str:
+        return os.getenv("TELEGRAM_BOT_TOKEN", os.getenv("TelegramBotToken", ""))
+
+    @cached_property
+    def telegram_chat_id(self) -> str:
+        return os.getenv("TELEGRAM_CHAT_ID", os.getenv("TelegramChatId", ""))
+
+    # 브로커 선택: paper | kis
+    @cached_property
+    def broker(self) -> str:
+        return os.getenv("BROKER", "paper").lower()
+
+    # KIS (한국투자증권) 연동 설정
+    @cached_property
+    def kis_app_key(self) -> str:
+        return os.getenv("KIS_APP_KEY", "")
+
+    @cached_property
+    def kis_app_secret(self) -> str:
+        return os.getenv("KIS_APP_SECRET", "")
+
+    @cached_property
+    def kis_account_no(self) -> str:
+        return os.getenv("KIS_ACCOUNT_NO", "")
+
+    @cached_property
+    def kis_product_code(self) -> str:
+        return os.getenv("KIS_PRODUCT_CODE", "01")
+
+    @cached_property
+    def kis_mode(self) -> str:
+        return os.getenv("KIS_MODE", "paper")
+
+    @cached_property
+    def kis_base_url(self) -> str:
+        return os.getenv("KIS_BASE_URL", "")
+
+    # 빈 값이면 토큰 파일 캐시 비활성화
+    @cached_property
+    def kis_token_cache_path(self) -> str:
+        return os.getenv("KIS_TOKEN_CACHE_PATH", str(Path.home() / ".cache" / "stock_trader" / "kis_token.json"))
+
+    # Demo behavior
+    @cached_property
+    def enable_demo_auto_close(self) -> bool:
+        return os.getenv("ENABLE_DEMO_AUTO_CLOSE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+    # Scheduler
+    @cached_property
+    def exit_cycle_interval_sec(self) -> int:
+        return int(os.getenv("EXIT_CYCLE_INTERVAL_SEC", "60"))
+
+    # Risk limits
+    @cached_property
+    def risk_max_loss_per_trade(self) -> float:
+        return float(os.getenv("RISK_MAX_LOSS_PER_TRADE", "30000"))
+
+    @cached_property
+    def risk_daily_loss_limit(self) -> float:
+        return float(os.getenv("RISK_DAILY_LOSS_LIMIT", "100000"))
+
+    @cached_property
+    def risk_max_exposure_per_symbol(self) -> float:
+        return float(os.getenv("RISK_MAX_EXPOSURE_PER_SYMBOL", "300000"))
+
+    @cached_property
+    def risk_max_concurrent_positions(self) -> int:
+        return int(os.getenv("RISK_MAX_CONCURRENT_POSITIONS", "3"))
+
+    @cached_property
+    def risk_loss_streak_cooldown(self) -> int:
+        return int(os.getenv("RISK_LOSS_STREAK_COOLDOWN", "3"))
+
+    @cached_property
+    def risk_cooldown_minutes(self) -> int:
+        return int(os.getenv("RISK_COOLDOWN_MINUTES", "60"))
+
+    @cached_property
+    def risk_assumed_stop_loss_pct(self) -> float:
+        return float(os.getenv("RISK_ASSUMED_STOP_LOSS_PCT", "0.015"))
+
+    @cached_property
+    def risk_target_position_value(self) -> float:
+        return float(os.getenv("RISK_TARGET_POSITION_VALUE", "100000"))
+
+    # News ingestion
+    @cached_property
+    def news_mode(self) -> str:
+        return os.getenv("NEWS_MODE", "sample").lower()  # sample | rss
+
+    @cached_property
+    def news_rss_url(self) -> str:
+        return os.getenv("NEWS_RSS_URL", "https://www.mk.co.kr/rss/30000001/")
+
     def reload(self):
         """설정을 다시 로드합니다 (런타임 환경변수 변경 시 호출)."""
-        self._reload()
+        for name, attr in type(self).__dict__.items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
 
 
 # 싱글턴 인스턴스 생성
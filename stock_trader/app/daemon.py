@@ -88,6 +88,9 @@ def daemon_loop():
                 _shutdown_event.wait(timeout=30)
                 continue
 
+            # 다른 프로세스가 바꾼 파라미터는 주기당 한 번만 확인
+            db.refresh_parameter_cache()
+
             # --- 장 마감 임박 체크: 신규 진입 차단 ---
             remaining_min = minutes_until_market_close()
             entry_allowed = remaining_min is not None and remaining_min > ENTRY_CUTOFF_MINUTES
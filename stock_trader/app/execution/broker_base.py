@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     signal_id: int
     ticker: str
@@ -12,7 +12,7 @@ class OrderRequest:
     expected_price: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     status: str
     filled_qty: float
@@ -1,13 +1,16 @@
-import json
 from datetime import datetime
 from typing import Callable, Literal
 
 from app.execution.broker_base import OrderRequest
 from app.risk.engine import can_trade
-from app.storage.db import DB
+from app.storage.db import DB, dumps_json
 
 ExecStatus = Literal["FILLED", "PENDING", "BLOCKED"]
 
+SIDE_BUY = "BUY"
+SIDE_SELL = "SELL"
+ORDER_TYPE_MARKET = "MARKET"
+
 
 def execute_signal_impl(
     db: DB,
@@ -21,15 +24,22 @@ def execute_signal_impl(
     _sync_entry_order_once: Callable,
     log_and_notify: Callable,
     settings,
+    trade_date: str | None = None,
 ) -> ExecStatus:
-    """Tx #2 + Tx #3: risk gate, order/position lifecycle, and close simulation.
+    """Tx #2 (+ Tx #3): risk gate, order/position lifecycle, and close simulation.
+
+    데모 자동청산(Tx #3)은 진입이 즉시 체결된 경우 Tx #2와 같은 트랜잭션에서 커밋된다.
 
     Returns:
       - "FILLED": 진입 체결 및 (데모 모드) 청산까지 완료
       - "PENDING": 주문 접수만 완료(미체결)
       - "BLOCKED": 리스크/주문 거부로 실행 차단
+
+    trade_date를 넘기면 여러 신호를 연속 실행할 때 날짜 계산을 재사용한다.
     """
-    trade_date = datetime.now().date().isoformat()
+    if trade_date is None:
+        trade_date = datetime.now().date().isoformat()
+    auto_close = settings.enable_demo_auto_close if demo_auto_close is None else bool(demo_auto_close)
 
     db.begin()
     try:
@@ -44,7 +54,7 @@ def execute_signal_impl(
         expected_price = _resolve_expected_price(broker, ticker)
         if expected_price is None:
             db.rollback()
-            log_and_notify(f"BLOCKED:NO_PRICE ticker={ticker} signal_id={signal_id}")
+            log_and_notify("BLOCKED:NO_PRICE ticker=%s signal_id=%s", ticker, signal_id)
             return "BLOCKED"
 
         effective_qty = float(qty or 0.0)
@@ -52,19 +62,20 @@ def execute_signal_impl(
             target_value = max(0.0, float(getattr(settings, "risk_target_position_value", 0.0) or 0.0))
             if target_value <= 0:
                 db.rollback()
-                log_and_notify(f"BLOCKED:INVALID_QTY ticker={ticker} signal_id={signal_id}")
+                log_and_notify("BLOCKED:INVALID_QTY ticker=%s signal_id=%s", ticker, signal_id)
                 return "BLOCKED"
             effective_qty = max(1.0, float(int(target_value / expected_price)))
 
+        open_count, symbol_exposure = db.get_open_position_stats(ticker)
         risk = can_trade(
             account_state=rs,
             proposed_notional=effective_qty * expected_price,
-            current_open_positions=db.count_open_positions(),
-            current_symbol_exposure=db.get_open_exposure_for_ticker(ticker),
+            current_open_positions=open_count,
+            current_symbol_exposure=symbol_exposure,
         )
         if not risk.allowed:
             db.rollback()
-            log_and_notify(f"BLOCKED:{risk.reason_code}")
+            log_and_notify("BLOCKED:%s", risk.reason_code)
             return "BLOCKED"
 
         position_id = db.create_position(ticker, signal_id, effective_qty, autocommit=False)
@@ -72,9 +83,9 @@ def execute_signal_impl(
             position_id=position_id,
             signal_id=signal_id,
             ticker=ticker,
-            side="BUY",
+            side=SIDE_BUY,
             qty=effective_qty,
-            order_type="MARKET",
+            order_type=ORDER_TYPE_MARKET,
             status="SENT",
             price=None,
             autocommit=False,
@@ -84,7 +95,7 @@ def execute_signal_impl(
             OrderRequest(
                 signal_id=signal_id,
                 ticker=ticker,
-                side="BUY",
+                side=SIDE_BUY,
                 qty=effective_qty,
                 expected_price=expected_price,
             )
@@ -100,8 +111,8 @@ def execute_signal_impl(
             )
             db.commit()
             log_and_notify(
-                f"ORDER_SENT_PENDING:{ticker} "
-                f"(signal_id={signal_id}, position_id={position_id}, order_id={order_id}, broker_order_id={result.broker_order_id or '-'})"
+                "ORDER_SENT_PENDING:%s (signal_id=%s, position_id=%s, order_id=%s, broker_order_id=%s)",
+                ticker, signal_id, position_id, order_id, result.broker_order_id or "-",
             )
             sync_result = _sync_entry_order_once(
                 db,
@@ -123,33 +134,21 @@ def execute_signal_impl(
                 event_type="BLOCK",
                 action="BLOCKED",
                 reason_code=result.reason_code or "ORDER_NOT_FILLED",
-                detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id}),
+                detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id}),
                 idempotency_key=f"block:{position_id}:{order_id}",
                 autocommit=False,
             )
             db.rollback()
-            log_and_notify(f"BLOCKED:{result.reason_code or 'ORDER_NOT_FILLED'}")
+            log_and_notify("BLOCKED:%s", result.reason_code or "ORDER_NOT_FILLED")
             return "BLOCKED"
 
-        db.update_order_filled(
+        entry_key = f"entry:{position_id}:{order_id}"
+        first_event_id = db.record_entry_fill(
+            position_id=position_id,
             order_id=order_id,
             price=result.avg_price,
-            broker_order_id=result.broker_order_id,
-            autocommit=False,
-        )
-        db.set_position_open(
-            position_id=position_id,
-            avg_entry_price=result.avg_price,
             opened_value=result.avg_price * effective_qty,
-            autocommit=False,
-        )
-        entry_key = f"entry:{position_id}:{order_id}"
-        first_event_id = db.insert_position_event(
-            position_id=position_id,
-            event_type="ENTRY",
-            action="EXECUTED",
-            reason_code="ENTRY_FILLED",
-            detail_json=json.dumps(
+            detail_json=dumps_json(
                 {
                     "signal_id": signal_id,
                     "order_id": order_id,
@@ -158,56 +157,46 @@ def execute_signal_impl(
                 }
             ),
             idempotency_key=entry_key,
+            broker_order_id=result.broker_order_id,
             autocommit=False,
         )
+        if auto_close:
+            # Tx #3 (demo): 청산 시뮬레이션(OPEN -> CLOSED)을 진입 트랜잭션에 합쳐 커밋 1회로 처리
+            exit_price = float(result.avg_price or 0.0)
+            exit_order_id = db.insert_filled_order(
+                position_id=position_id,
+                signal_id=signal_id,
+                ticker=ticker,
+                side=SIDE_SELL,
+                qty=effective_qty,
+                order_type=ORDER_TYPE_MARKET,
+                price=exit_price,
+                autocommit=False,
+            )
+            db.apply_realized_pnl(trade_date, (exit_price - float(result.avg_price or 0.0)) * effective_qty, autocommit=False)
+            db.set_position_closed(position_id=position_id, reason_code="TIME_EXIT", autocommit=False)
+            db.insert_position_event(
+                position_id=position_id,
+                event_type="FULL_EXIT",
+                action="EXECUTED",
+                reason_code="TIME_EXIT",
+                detail_json=dumps_json(
+                    {
+                        "signal_id": signal_id,
+                        "exit_order_id": exit_order_id,
+                        "exit_price": exit_price,
+                    }
+                ),
+                idempotency_key=f"exit:{position_id}:{exit_order_id}",
+                autocommit=False,
+            )
         db.commit()
         log_and_notify(
-            f"ORDER_FILLED:{ticker}@{result.avg_price} "
-            f"(signal_id={signal_id}, position_id={position_id}, entry_event_id={first_event_id})"
+            "ORDER_FILLED:%s@%s (signal_id=%s, position_id=%s, entry_event_id=%s)",
+            ticker, result.avg_price, signal_id, position_id, first_event_id,
         )
-    except Exception:
-        db.rollback()
-        raise
-
-    auto_close = settings.enable_demo_auto_close if demo_auto_close is None else bool(demo_auto_close)
-    if not auto_close:
-        return "FILLED"
-
-    # Tx #3 (optional): simple close simulation (OPEN -> CLOSED)
-    db.begin()
-    try:
-        exit_order_id = db.insert_order(
-            position_id=position_id,
-            signal_id=signal_id,
-            ticker=ticker,
-            side="SELL",
-            qty=effective_qty,
-            order_type="MARKET",
-            status="SENT",
-            price=None,
-            autocommit=False,
-        )
-        exit_price = float(result.avg_price or 0.0)
-        db.update_order_filled(order_id=exit_order_id, price=exit_price, autocommit=False)
-        db.apply_realized_pnl(trade_date, (exit_price - float(result.avg_price or 0.0)) * effective_qty, autocommit=False)
-        db.set_position_closed(position_id=position_id, reason_code="TIME_EXIT", autocommit=False)
-        db.insert_position_event(
-            position_id=position_id,
-            event_type="FULL_EXIT",
-            action="EXECUTED",
-            reason_code="TIME_EXIT",
-            detail_json=json.dumps(
-                {
-                    "signal_id": signal_id,
-                    "exit_order_id": exit_order_id,
-                    "exit_price": exit_price,
-                }
-            ),
-            idempotency_key=f"exit:{position_id}:{exit_order_id}",
-            autocommit=False,
-        )
-        db.commit()
-        log_and_notify(f"POSITION_CLOSED:{position_id} reason=TIME_EXIT")
+        if auto_close:
+            log_and_notify("POSITION_CLOSED:%s reason=TIME_EXIT", position_id)
         return "FILLED"
     except Exception:
         db.rollback()
@@ -1,7 +1,10 @@
+import hashlib
 import json
 import time
 import logging
+import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 from datetime import datetime
 
@@ -9,6 +12,11 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson  # optional: 주문 응답 파싱 가속
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from .broker_base import BrokerBase, OrderRequest, OrderResult
 from app.config import settings
 
@@ -26,16 +34,25 @@ class KISToken:
     expires_at: float = 0.0  # Unix timestamp
 
 
+def _loads_body(content: bytes) -> Any:
+    """응답 본문(bytes) JSON 파싱. orjson이 있으면 사용."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 def _build_session() -> requests.Session:
     """재시도 + keep-alive 설정된 Session 생성."""
     s = requests.Session()
+    # 일시적 게이트웨이 오류만 짧게 재시도해 tail latency 상한을 둔다
     retry = Retry(
-        total=3,
-        backoff_factor=0.5,
-        status_forcelist=[500, 502, 503, 504],
-        allowed_methods=["GET", "POST"],
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
     )
-    adapter = HTTPAdapter(max_retries=retry, pool_connections=2, pool_maxsize=5)
+    # 주문 폭주 시 새 커넥션 생성을 줄이도록 풀 확대
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=32)
     s.mount("https://", adapter)
     return s
 
@@ -78,8 +95,22 @@ class KISBroker(BrokerBase):
                 else "https://openapi.koreainvestment.com:9443"
             )
         self.mode = mode
+        # 주문/조회 tr_id와 고정 헤더는 인스턴스 생성 시 한 번만 계산
+        if mode == "paper":
+            self._tr_id_map = {"BUY": "VTTT0802U", "SELL": "VTTT0801U"}
+            self._tr_id_inquire = "VTTC8001R"
+        else:
+            self._tr_id_map = {"BUY": "TTTC0802U", "SELL": "TTTC0801U"}
+            self._tr_id_inquire = "TTTC8001R"
+        self._base_headers = {
+            "appkey": settings.kis_app_key,
+            "appsecret": settings.kis_app_secret,
+            "custtype": "P",
+        }
+        self._cano, self._prdt = self._split_account()
         self.session = _build_session()
         self._token: KISToken | None = None
+        self._token_cache_mtime: float | None = None
 
     def _split_account(self) -> tuple[str, str]:
         raw = (settings.kis_account_no or "").strip()
@@ -91,8 +122,7 @@ class KISBroker(BrokerBase):
     def _ensure_credentials(self) -> None:
         if not settings.kis_app_key or not settings.kis_app_secret:
             raise KISBrokerError("KIS credentials missing")
-        cano, _ = self._split_account()
-        if not cano:
+        if not self._cano:
             raise KISBrokerError("KIS account number missing")
 
     def _issue_token(self) -> KISToken:
@@ -111,33 +141,109 @@ class KISBroker(BrokerBase):
         if not token:
             raise KISBrokerError(f"token missing in response: {json.dumps(data, ensure_ascii=False)[:250]}")
 
-        import time
+        self._token = KISToken(
+            access_token=token,
+            token_type=data.get("token_type", "Bearer"),
+            expires_at=self._parse_token_expiry(data),
+        )
+        self._save_cached_token(self._token)
+        return self._token
+
+    @staticmethod
+    def _parse_token_expiry(data: dict[str, Any]) -> float:
+        """토큰 응답에서 만료 시각(Unix timestamp)을 계산."""
+        # expires_in(초)을 우선 사용
+        try:
+            expires_in = int(data.get("expires_in") or 0)
+        except (TypeError, ValueError):
+            expires_in = 0
+        if expires_in > 0:
+            return time.time() + expires_in
+
         # KIS access_token_token_expired 는 "YYYY-MM-DD HH:MM:SS" 형태
         expires_str = data.get("access_token_token_expired", "")
         try:
-            from datetime import datetime as _dt
-            exp_dt = _dt.strptime(expires_str, "%Y-%m-%d %H:%M:%S")
-            expires_at = exp_dt.timestamp()
+            return datetime.strptime(expires_str, "%Y-%m-%d %H:%M:%S").timestamp()
         except Exception:
             # 파싱 실패 시 기본 23시간 후 만료 가정
-            expires_at = time.time() + 23 * 3600
+            return time.time() + 23 * 3600
 
-        self._token = KISToken(
-            access_token=token,
-            token_type=data.get("token_type", "Bearer"),
-            expires_at=expires_at,
-        )
-        return self._token
+    def _token_cache_file(self) -> Path | None:
+        raw = (settings.kis_token_cache_path or "").strip()
+        return Path(raw).expanduser() if raw else None
+
+    def _token_cache_owner(self) -> str:
+        # 앱키 원문 대신 해시로 소유자 식별 (계정/모드가 바뀌면 캐시 무효)
+        return hashlib.sha256(f"{settings.kis_app_key}|{self.base_url}".encode("utf-8")).hexdigest()
+
+    def _load_cached_token(self) -> KISToken | None:
+        """프로세스 재시작 시 파일에 저장된 토큰 재사용 (KIS 토큰 발급은 1분 1회 제한)."""
+        path = self._token_cache_file()
+        if path is None:
+            return None
+        try:
+            mtime = path.stat().st_mtime
+            if self._token_cache_mtime == mtime:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self._token_cache_mtime = mtime
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("owner") != self._token_cache_owner():
+            return None
+        try:
+            tok = KISToken(
+                access_token=str(data["access_token"]),
+                token_type=str(data.get("token_type") or "Bearer"),
+                expires_at=float(data["expires_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if time.time() >= tok.expires_at - self.TOKEN_REFRESH_MARGIN_SEC:
+            return None
+        return tok
+
+    def _save_cached_token(self, tok: KISToken) -> None:
+        path = self._token_cache_file()
+        if path is None:
+            return
+        payload = {
+            "owner": self._token_cache_owner(),
+            "access_token": tok.access_token,
+            "token_type": tok.token_type,
+            "expires_at": tok.expires_at,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            # 토큰을 쓰기 전에 0600으로 생성 (umask 권한으로 잠시라도 노출되지 않게)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                os.fchmod(f.fileno(), 0o600)  # 이전에 남은 tmp 파일의 권한도 교정
+                f.write(json.dumps(payload))
+            tmp.replace(path)
+            self._token_cache_mtime = path.stat().st_mtime
+        except OSError as e:
+            _log.warning("KIS 토큰 캐시 저장 실패: %s", e)
 
     def _auth_header(self) -> dict[str, str]:
         tok = self._token
         if tok is None or time.time() >= tok.expires_at - self.TOKEN_REFRESH_MARGIN_SEC:
-            tok = self._issue_token()
+            tok = self._load_cached_token()
+            if tok is None:
+                tok = self._issue_token()
+            self._token = tok
         return {"authorization": f"Bearer {tok.access_token}"}
 
     def _invalidate_token(self) -> None:
         """토큰을 무효화하여 다음 요청 시 재발급."""
         self._token = None
+        path = self._token_cache_file()
+        if path is not None:
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
     def _request_with_auth_retry(
         self,
@@ -155,13 +261,7 @@ class KISBroker(BrokerBase):
         """
         for attempt in range(self.MAX_TOKEN_RETRIES + 1):
             auth = self._auth_header()
-            merged_headers = {
-                **(headers or {}),
-                **auth,
-                "appkey": settings.kis_app_key,
-                "appsecret": settings.kis_app_secret,
-                "custtype": "P",
-            }
+            merged_headers = {**(headers or {}), **auth, **self._base_headers}
             try:
                 if method.upper() == "POST":
                     r = self.session.post(url, headers=merged_headers, json=json_body, timeout=timeout)
@@ -183,21 +283,18 @@ class KISBroker(BrokerBase):
         raise KISBrokerError("KIS request failed: max retries exceeded")
 
     def _tr_id_order(self, side: str) -> str:
-        s = (side or "").upper()
-        if self.mode == "paper":
-            return "VTTT0802U" if s == "BUY" else "VTTT0801U"
-        return "TTTC0802U" if s == "BUY" else "TTTC0801U"
+        # BUY 이외는 매도 코드 (기존 동작 유지)
+        return self._tr_id_map.get((side or "").upper(), self._tr_id_map["SELL"])
 
     def _order_cash(self, req: OrderRequest) -> dict[str, Any]:
-        cano, prdt = self._split_account()
         tr_id = self._tr_id_order(req.side)
         url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-cash"
         qty = max(1, int(round(req.qty)))
 
         # 시장가(01) 고정. 지정가 확장은 후속 단계에서.
         body = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": prdt,
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._prdt,
             "PDNO": req.ticker,
             "ORD_DVSN": "01",
             "ORD_QTY": str(qty),
@@ -211,7 +308,7 @@ class KISBroker(BrokerBase):
         )
         if not r.ok:
             raise KISBrokerError(f"order failed: HTTP {r.status_code} {r.text[:200]}")
-        return r.json()
+        return _loads_body(r.content)
 
     def send_order(self, req: OrderRequest) -> OrderResult:
         """주문 전송.
@@ -244,12 +341,11 @@ class KISBroker(BrokerBase):
         if not broker_order_id:
             return None
 
-        cano, prdt = self._split_account()
         today = datetime.now().strftime("%Y%m%d")
         url = f"{self.base_url}/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
         params = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": prdt,
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._prdt,
             "INQR_STRT_DT": today,
             "INQR_END_DT": today,
             "SLL_BUY_DVSN_CD": "00",
@@ -265,7 +361,7 @@ class KISBroker(BrokerBase):
         try:
             r = self._request_with_auth_retry(
                 "GET", url,
-                headers={"tr_id": "VTTC8001R" if self.mode == "paper" else "TTTC8001R"},
+                headers={"tr_id": self._tr_id_inquire},
                 params=params,
                 timeout=10,
             )
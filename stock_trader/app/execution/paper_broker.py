@@ -1,21 +1,29 @@
+import itertools
 import random
 import time
 from .broker_base import BrokerBase, OrderRequest, OrderResult
 
 
 class PaperBroker(BrokerBase):
-    """P0 minimal: market order full-fill only."""
+    """P0 minimal: market order full-fill only.
 
-    def __init__(self, base_latency_ms: int = 100):
+    simulate_latency=False 이면 주문 지연(sleep)을 생략한다 (백테스트/리플레이용).
+    """
+
+    def __init__(self, base_latency_ms: int = 100, simulate_latency: bool = True):
         self.base_latency_ms = base_latency_ms
+        self.simulate_latency = simulate_latency
         self._orders: dict[str, OrderResult] = {}
+        self._seq = itertools.count(1)
 
-    def send_order(self, req: OrderRequest) -> OrderResult:
-        latency = self.base_latency_ms + random.randint(0, 80)
-        time.sleep(latency / 1000)
+    def _latency_ms(self) -> int:
+        return self.base_latency_ms + random.randint(0, 80)
+
+    def _fill(self, req: OrderRequest) -> OrderResult:
         # P0: use caller-provided expected_price when available
         mock_price = req.expected_price if req.expected_price is not None else 100.0
-        oid = f"PAPER-{int(time.time()*1000)}"
+        # 같은 ms 안의 여러 주문도 구분되도록 순번 추가
+        oid = f"PAPER-{int(time.time()*1000)}-{next(self._seq)}"
         result = OrderResult(
             status="FILLED",
             filled_qty=req.qty,
@@ -25,6 +33,20 @@ class PaperBroker(BrokerBase):
         self._orders[oid] = result
         return result
 
+    def send_order(self, req: OrderRequest) -> OrderResult:
+        if self.simulate_latency:
+            time.sleep(self._latency_ms() / 1000)
+        return self._fill(req)
+
+    def send_orders(self, reqs: list[OrderRequest]) -> list[OrderResult]:
+        """여러 주문을 한 번에 체결.
+
+        동시 전송으로 보고 지연은 배치 전체에 대해 최대값으로 한 번만 적용한다.
+        """
+        if self.simulate_latency and reqs:
+            time.sleep(max(self._latency_ms() for _ in reqs) / 1000)
+        return [self._fill(req) for req in reqs]
+
     def inquire_order(self, broker_order_id: str, ticker: str, side: str = "BUY") -> OrderResult | None:
         return self._orders.get(broker_order_id)
 
@@ -1,9 +1,8 @@
-import json
 from datetime import datetime, timezone
 from typing import Callable
 
 from app.execution.broker_base import OrderRequest
-from app.storage.db import DB
+from app.storage.db import DB, dumps_json
 from app.common.timeutil import parse_utc_ts
 
 
@@ -68,7 +67,7 @@ def sync_pending_entries_impl(
                             event_type="BLOCK",
                             action="BLOCKED",
                             reason_code="RETRY_EXHAUSTED",
-                            detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id, "attempt_no": attempt_no}),
+                            detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id, "attempt_no": attempt_no}),
                             idempotency_key=f"block-retry:{position_id}:{order_id}",
                             autocommit=False,
                         )
@@ -142,7 +141,7 @@ def sync_pending_entries_impl(
                                 event_type="ENTRY",
                                 action="EXECUTED",
                                 reason_code="ENTRY_FILLED",
-                                detail_json=json.dumps(
+                                detail_json=dumps_json(
                                     {
                                         "signal_id": signal_id,
                                         "order_id": new_order_id,
@@ -177,7 +176,7 @@ def sync_pending_entries_impl(
                                 event_type="BLOCK",
                                 action="BLOCKED",
                                 reason_code=reason,
-                                detail_json=json.dumps({"signal_id": signal_id, "order_id": new_order_id, "original_reason": new_result.reason_code}),
+                                detail_json=dumps_json({"signal_id": signal_id, "order_id": new_order_id, "original_reason": new_result.reason_code}),
                                 idempotency_key=f"block:{position_id}:{new_order_id}",
                                 autocommit=False,
                             )
@@ -1,7 +1,6 @@
-import json
 from datetime import datetime, timezone
 from typing import Literal
-from app.storage.db import DB
+from app.storage.db import DB, dumps_json
 
 ExecStatus = Literal["FILLED", "PENDING", "BLOCKED", "PARTIAL_FILLED"]
 
@@ -46,7 +45,7 @@ def sync_entry_order_once(
                 event_type="ENTRY",
                 action="EXECUTED",
                 reason_code="ENTRY_FILLED",
-                detail_json=json.dumps(
+                detail_json=dumps_json(
                     {
                         "signal_id": signal_id,
                         "order_id": order_id,
@@ -77,7 +76,7 @@ def sync_entry_order_once(
                 event_type="BLOCK",
                 action="BLOCKED",
                 reason_code=status.reason_code or status.status,
-                detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id}),
+                detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id}),
                 idempotency_key=f"block:{position_id}:{order_id}",
                 autocommit=False,
             )
@@ -87,60 +86,65 @@ def sync_entry_order_once(
 
         if status.status == "PARTIAL_FILLED":
             filled_qty = float(status.filled_qty or 0.0)
-            db.update_order_partial(
-                order_id=order_id,
-                price=float(status.avg_price or 0.0),
-                filled_qty=filled_qty,
-                broker_order_id=broker_order_id,
-                autocommit=False,
-            )
-            db.insert_position_event(
-                position_id=position_id,
-                event_type="ADD",
-                action="EXECUTED",
-                reason_code="PARTIAL_FILLED",
-                detail_json=json.dumps(
-                    {
-                        "signal_id": signal_id,
-                        "order_id": order_id,
-                        "filled_qty": status.filled_qty,
-                        "avg_price": status.avg_price,
-                    }
-                ),
-                idempotency_key=f"partial:{position_id}:{order_id}:{int(float(status.filled_qty or 0)*10000)}",
-                autocommit=False,
-            )
-            if filled_qty >= float(qty) - 1e-9:
-                db.update_order_filled(order_id, float(status.avg_price or 0), filled_qty, broker_order_id, False)
-                db.set_position_open(
-                    position_id=position_id,
-                    avg_entry_price=float(status.avg_price or 0.0),
-                    opened_value=float(status.avg_price or 0.0) * qty,
+            fully_filled = filled_qty >= float(qty) - 1e-9
+            # ADD/ENTRY 이벤트는 모았다가 현재 트랜잭션 안에서 executemany 한 번으로 기록
+            with db.begin_event_batch() as events:
+                db.update_order_partial(
+                    order_id=order_id,
+                    price=float(status.avg_price or 0.0),
+                    filled_qty=filled_qty,
+                    broker_order_id=broker_order_id,
                     autocommit=False,
                 )
-                db.insert_position_event(
-                    position_id=position_id,
-                    event_type="ENTRY",
-                    action="EXECUTED",
-                    reason_code="ENTRY_FILLED",
-                    detail_json=json.dumps(
-                        {
-                            "signal_id": signal_id,
-                            "order_id": order_id,
-                            "filled_qty": filled_qty,
-                            "avg_price": status.avg_price,
-                        }
-                    ),
-                    idempotency_key=f"entry:{position_id}:{order_id}",
-                    autocommit=False,
+                events.append(
+                    (
+                        position_id,
+                        "ADD",
+                        "EXECUTED",
+                        "PARTIAL_FILLED",
+                        dumps_json(
+                            {
+                                "signal_id": signal_id,
+                                "order_id": order_id,
+                                "filled_qty": status.filled_qty,
+                                "avg_price": status.avg_price,
+                            }
+                        ),
+                        f"partial:{position_id}:{order_id}:{int(float(status.filled_qty or 0)*10000)}",
+                    )
                 )
-                db.commit()
+                if fully_filled:
+                    db.update_order_filled(order_id, float(status.avg_price or 0), filled_qty, broker_order_id, False)
+                    db.set_position_open(
+                        position_id=position_id,
+                        avg_entry_price=float(status.avg_price or 0.0),
+                        opened_value=float(status.avg_price or 0.0) * qty,
+                        autocommit=False,
+                    )
+                    events.append(
+                        (
+                            position_id,
+                            "ENTRY",
+                            "EXECUTED",
+                            "ENTRY_FILLED",
+                            dumps_json(
+                                {
+                                    "signal_id": signal_id,
+                                    "order_id": order_id,
+                                    "filled_qty": filled_qty,
+                                    "avg_price": status.avg_price,
+                                }
+                            ),
+                            f"entry:{position_id}:{order_id}",
+                        )
+                    )
+            db.commit()
+            if fully_filled:
                 log_and_notify(
                     f"ORDER_FILLED:{ticker}@{status.avg_price} "
                     f"(signal_id={signal_id}, position_id={position_id}, partial_complete=True)"
                 )
                 return "FILLED"
-            db.commit()
             return "PARTIAL_FILLED"
 
         db.update_order_status(order_id, status.status, broker_order_id, False)
@@ -194,14 +198,14 @@ def sync_exit_order_once(
             if cum_exit >= total_qty - 1e-9:
                 db.set_position_closed(position_id, "FULL_EXIT_FILLED", total_qty, False)
                 db.insert_position_event(position_id, "FULL_EXIT", "EXECUTED", "FULL_EXIT_FILLED", 
-                                       json.dumps({"signal_id": signal_id, "order_id": order_id, "pnl": pnl_delta}),
+                                       dumps_json({"signal_id": signal_id, "order_id": order_id, "pnl": pnl_delta}),
                                        f"exit-fill:{position_id}:{order_id}", False)
                 db.commit()
                 return "FILLED"
 
             db.set_position_partial_exit(position_id, cum_exit, False)
             db.insert_position_event(position_id, "PARTIAL_EXIT", "EXECUTED", "PARTIAL_EXIT_FILLED",
-                                   json.dumps({"signal_id": signal_id, "pnl": pnl_delta}),
+                                   dumps_json({"signal_id": signal_id, "pnl": pnl_delta}),
                                    f"partial-exit:{position_id}:{order_id}:{int(filled_qty*10000)}", False)
             db.commit()
             return "PENDING"
@@ -209,7 +213,7 @@ def sync_exit_order_once(
         if status.status in {"REJECTED", "CANCELLED", "EXPIRED"}:
             db.update_order_status(order_id, status.status, broker_order_id, False)
             db.insert_position_event(position_id, "BLOCK", "BLOCKED", status.reason_code or status.status,
-                                   json.dumps({"order_id": order_id}), f"exit-block:{position_id}:{order_id}", False)
+                                   dumps_json({"order_id": order_id}), f"exit-block:{position_id}:{order_id}", False)
             db.commit()
             return "BLOCKED"
 
@@ -1,10 +1,9 @@
-import json
 from datetime import datetime, timezone
 from typing import Callable
 
 from app.execution.broker_base import OrderRequest
 from app.execution.exit_policy import should_exit_on_opposite_signal, should_exit_on_time
-from app.storage.db import DB
+from app.storage.db import DB, dumps_json
 
 
 def trigger_stop_loss_orders_impl(
@@ -88,7 +87,7 @@ def trigger_stop_loss_orders_impl(
                 db.set_position_closed(position_id=position_id, reason_code="STOP_LOSS", exited_qty=total_qty, autocommit=False)
                 db.insert_position_event(position_id=position_id, event_type="FULL_EXIT", action="EXECUTED",
                     reason_code="STOP_LOSS",
-                    detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id, "loss_pct": round(loss_pct, 4)}),
+                    detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id, "loss_pct": round(loss_pct, 4)}),
                     idempotency_key=f"stoploss-exit:{position_id}:{order_id}", autocommit=False)
                 db.commit()
                 created += 1
@@ -213,7 +212,7 @@ def trigger_trailing_stop_orders_impl(
                     event_type="FULL_EXIT",
                     action="EXECUTED",
                     reason_code="TRAILING_STOP",
-                    detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id, "filled_qty": send.filled_qty, "avg_price": send.avg_price}),
+                    detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id, "filled_qty": send.filled_qty, "avg_price": send.avg_price}),
                     idempotency_key=f"trail-exit:{position_id}:{order_id}",
                     autocommit=False,
                 )
@@ -227,7 +226,7 @@ def trigger_trailing_stop_orders_impl(
                 event_type="BLOCK",
                 action="BLOCKED",
                 reason_code=send.reason_code or "EXIT_ORDER_REJECTED",
-                detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id}),
+                detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id}),
                 idempotency_key=f"trail-block:{position_id}:{order_id}",
                 autocommit=False,
             )
@@ -351,7 +350,7 @@ def trigger_opposite_signal_exit_orders_impl(
                     event_type="FULL_EXIT",
                     action="EXECUTED",
                     reason_code="OPPOSITE_SIGNAL",
-                    detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id, "decision": decision, "score": score}),
+                    detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id, "decision": decision, "score": score}),
                     idempotency_key=f"oppo-exit:{position_id}:{order_id}",
                     autocommit=False,
                 )
@@ -365,7 +364,7 @@ def trigger_opposite_signal_exit_orders_impl(
                 event_type="BLOCK",
                 action="BLOCKED",
                 reason_code=send.reason_code or "EXIT_ORDER_REJECTED",
-                detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id}),
+                detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id}),
                 idempotency_key=f"oppo-block:{position_id}:{order_id}",
                 autocommit=False,
             )
@@ -485,7 +484,7 @@ def trigger_time_exit_orders_impl(
                     event_type="FULL_EXIT",
                     action="EXECUTED",
                     reason_code="TIME_EXIT",
-                    detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id, "filled_qty": send.filled_qty, "avg_price": send.avg_price}),
+                    detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id, "filled_qty": send.filled_qty, "avg_price": send.avg_price}),
                     idempotency_key=f"time-exit:{position_id}:{order_id}",
                     autocommit=False,
                 )
@@ -500,7 +499,7 @@ def trigger_time_exit_orders_impl(
                 event_type="BLOCK",
                 action="BLOCKED",
                 reason_code=send.reason_code or "EXIT_ORDER_REJECTED",
-                detail_json=json.dumps({"signal_id": signal_id, "order_id": order_id}),
+                detail_json=dumps_json({"signal_id": signal_id, "order_id": order_id}),
                 idempotency_key=f"exit-block:{position_id}:{order_id}",
                 autocommit=False,
             )
@@ -8,7 +8,7 @@ from urllib.parse import urlparse
 import requests
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     source: str
     tier: int
@@ -23,8 +23,9 @@ class NewsFetchError(RuntimeError):
 
 
 def build_hash(item: NewsItem) -> str:
-    base = f"{item.source}|{item.url}|{item.title}".encode("utf-8")
-    return hashlib.sha256(base).hexdigest()
+    # 중복 제거용 키라 암호학적 강도는 불필요: SHA-256 대신 더 빠른 BLAKE2b(128bit) 사용
+    base = b"|".join((item.source.encode("utf-8"), item.url.encode("utf-8"), item.title.encode("utf-8")))
+    return hashlib.blake2b(base, digest_size=16).hexdigest()
 
 
 def _parse_pub_date(value: str | None) -> datetime:
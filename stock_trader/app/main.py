@@ -21,8 +21,21 @@ class SignalBundle(TypedDict):
 from app.execution.sync_logic import sync_entry_order_once, sync_exit_order_once, ExecStatus
 
 
+# 브로커 싱글턴: 주문마다 새 Session(커넥션 풀)을 만들지 않도록 재사용
+_broker_instance = None
+
+
 def _build_broker():
-    return build_broker()
+    global _broker_instance
+    if _broker_instance is None:
+        _broker_instance = build_broker()
+    return _broker_instance
+
+
+def reset_broker() -> None:
+    """공유 브로커 인스턴스를 폐기합니다 (테스트/설정 변경 시 사용)."""
+    global _broker_instance
+    _broker_instance = None
 
 
 def _resolve_expected_price(broker, ticker: str) -> float | None:
@@ -162,6 +175,7 @@ def execute_signal(
     ticker: str,
     qty: float = 1.0,
     demo_auto_close: bool | None = None,
+    trade_date: str | None = None,
 ) -> ExecStatus:
     from app.execution.entry import execute_signal_impl
     return execute_signal_impl(
@@ -175,9 +189,24 @@ def execute_signal(
         _sync_entry_order_once=_sync_entry_order_once,
         log_and_notify=log_and_notify,
         settings=settings,
+        trade_date=trade_date,
     )
 
 
+def execute_signals(
+    db: DB,
+    bundles: list[SignalBundle],
+    qty: float = 1.0,
+    demo_auto_close: bool | None = None,
+) -> list[ExecStatus]:
+    """여러 신호를 순서대로 실행합니다 (거래일은 한 번만 계산)."""
+    trade_date = datetime.now().date().isoformat()
+    return [
+        execute_signal(db, b["signal_id"], b["ticker"], qty=qty, demo_auto_close=demo_auto_close, trade_date=trade_date)
+        for b in bundles
+    ]
+
+
 def _collect_current_prices(db: DB, broker, limit: int = 100) -> dict[str, float]:
     return collect_current_prices(db, broker, limit=limit)
 
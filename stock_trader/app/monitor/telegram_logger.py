@@ -6,12 +6,37 @@ import time
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, Dict, Any
-from urllib import request, parse
 from queue import Queue, Empty
 from threading import Thread
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from app.config import settings
 
+
+def _build_telegram_session() -> requests.Session:
+    """keep-alive로 TLS 세션을 재사용하는 텔레그램 전송용 Session."""
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return s
+
+
+_TG_SESSION = _build_telegram_session()
+
+# 알림 전송 여부는 import 시 한 번만 평가 (테스트에서는 set_notify_enabled로 변경)
+_NOTIFY_ENABLED = (
+    os.getenv("STOCK_TRADER_NOTIFY", "1") == "1"
+    and "unittest" not in sys.modules
+    and bool(settings.telegram_bot_token and settings.telegram_chat_id)
+)
+
+
+def set_notify_enabled(enabled: bool) -> None:
+    """텔레그램 알림 전송 여부를 런타임에 변경합니다."""
+    global _NOTIFY_ENABLED
+    _NOTIFY_ENABLED = bool(enabled)
+
 # 로그 레벨 정의
 class LogLevel(Enum):
     DEBUG = "DEBUG"
@@ -112,28 +137,20 @@ class TelegramQueue:
     
     def _send_telegram_impl(self, text: str) -> bool:
         """텔레그램 메시지 전송 구현."""
-        if os.getenv("STOCK_TRADER_NOTIFY", "1") != "1":
-            return False
-        if "unittest" in sys.modules:
-            return False
-        if not settings.telegram_bot_token or not settings.telegram_chat_id:
+        if not _NOTIFY_ENABLED:
             return False
         
         url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
-        payload = parse.urlencode({
+        payload = {
             "chat_id": settings.telegram_chat_id,
             "text": text,
             "parse_mode": "HTML"
-        }).encode("utf-8")
-        
-        req = request.Request(url, data=payload, method="POST")
-        req.add_header("Content-Type", "application/x-www-form-urlencoded")
+        }
         
         try:
-            with request.urlopen(req, timeout=15) as resp:
-                body = resp.read().decode("utf-8")
-                ok = json.loads(body).get("ok", False)
-                return bool(ok)
+            resp = _TG_SESSION.post(url, data=payload, timeout=15)
+            ok = resp.json().get("ok", False)
+            return bool(ok)
         except Exception as e:
             print(f"Telegram send error: {e}")
             return False
@@ -177,6 +194,8 @@ _telegram_queue = TelegramQueue()
 
 def send_telegram(text: str, priority: int = 0) -> bool:
     """텔레그램 메시지를 비동기로 전송합니다."""
+    if not _NOTIFY_ENABLED:
+        return False
     _telegram_queue.add(text, priority)
     return True  # 큐에 추가 성공
 
@@ -189,21 +208,21 @@ def log_structured(
     notify_telegram: bool = False
 ) -> None:
     """구조화된 로그를 기록합니다."""
+    level_no = getattr(logging, level.value, logging.INFO)
+    should_log = _logger.isEnabledFor(level_no)
+    should_notify = notify_telegram and _NOTIFY_ENABLED and level in [LogLevel.ERROR, LogLevel.CRITICAL, LogLevel.WARNING]
+    if not should_log and not should_notify:
+        # 기록/전송 대상이 아니면 JSON/텍스트 직렬화 생략
+        return
+
     log_entry = StructuredLog(level, message, component, data, exception)
     
     # 로깅
-    log_method = {
-        LogLevel.DEBUG: _logger.debug,
-        LogLevel.INFO: _logger.info,
-        LogLevel.WARNING: _logger.warning,
-        LogLevel.ERROR: _logger.error,
-        LogLevel.CRITICAL: _logger.critical,
-    }.get(level, _logger.info)
-    
-    log_method(log_entry.to_json())
+    if should_log:
+        _logger.log(level_no, log_entry.to_json())
     
     # 텔레그램 알림 (필요시)
-    if notify_telegram and level in [LogLevel.ERROR, LogLevel.CRITICAL, LogLevel.WARNING]:
+    if should_notify:
         send_telegram(log_entry.to_text(), priority=1 if level == LogLevel.CRITICAL else 0)
 
 # 편의 함수
@@ -222,6 +241,13 @@ def log_critical(message: str, component: str = "system", data: Optional[Dict[st
     log_structured(LogLevel.CRITICAL, message, component, data, exception, notify_telegram=notify)
 
 # 하위 호환성을 위한 기존 함수
-def log_and_notify(text: str) -> None:
-    """기존 코드와의 호환성을 위한 함수."""
+def log_and_notify(text: str, *args: Any) -> None:
+    """기존 코드와의 호환성을 위한 함수.
+
+    args가 주어지면 text를 %-스타일 포맷으로 보고, INFO 로그가 활성화된 경우에만 포맷한다.
+    """
+    if args:
+        if not _logger.isEnabledFor(logging.INFO):
+            return
+        text = text % args
     log_info(text, component="legacy", notify=True)
@@ -1,7 +1,14 @@
+import re
+from bisect import bisect_right
 from dataclasses import dataclass
 
+try:
+    import ahocorasick  # pyahocorasick (optional)
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
 
-@dataclass
+
+@dataclass(slots=True)
 class MappingResult:
     ticker: str
     company_name: str
@@ -131,6 +138,69 @@ ALIASES = {
 }
 
 
+# 정확 매칭에서 단독으로 채택하지 않는 짧은 그룹명
+AMBIGUOUS_SHORT_FORMS = frozenset({"삼성", "현대", "LG", "SK"})
+
+
+def _build_exact_index() -> dict[str, tuple[tuple[int, int], str, str, str, float]]:
+    """정규화(소문자+공백 제거)된 alias -> (우선순위, alias, ticker, name, confidence).
+
+    우선순위는 (-len(alias), 등록 순서)로, 값이 작을수록 우선한다.
+    """
+    index: dict[str, tuple[tuple[int, int], str, str, str, float]] = {}
+    for order, (alias, (ticker, name, confidence)) in enumerate(ALIASES.items()):
+        if ticker == "":  # 애매한 매핑 스킵
+            continue
+        key = alias.lower().replace(" ", "")
+        rank = (-len(alias), order)
+        if key not in index or rank < index[key][0]:
+            index[key] = (rank, alias, ticker, name, confidence)
+    return index
+
+
+_EXACT_INDEX = _build_exact_index()
+
+# pyahocorasick 사용 가능하면 한 번의 선형 스캔으로 모든(겹치는) alias 매칭
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _key, _entry in _EXACT_INDEX.items():
+        _AUTOMATON.add_word(_key, _entry)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+
+# fallback: 위치마다 우선순위가 가장 높은 alias를 잡는 lookahead 정규식
+_EXACT_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(_EXACT_INDEX, key=lambda k: _EXACT_INDEX[k][0]))
+    + "))"
+)
+
+
+# 부분 매칭 후보 (ALIASES 등록 순서 유지, 최소 3글자)
+_PARTIAL_ALIASES: tuple[tuple[str, str, str, float], ...] = tuple(
+    (alias, ticker, name, confidence)
+    for alias, (ticker, name, confidence) in ALIASES.items()
+    if ticker != "" and alias not in AMBIGUOUS_SHORT_FORMS and len(alias) >= 3
+)
+
+# 티커 -> (name, confidence): 같은 티커는 먼저 등록된 alias 기준
+_TICKER_INDEX: dict[str, tuple[str, float]] = {}
+for _ticker, _name, _confidence in ALIASES.values():
+    if _ticker:
+        _TICKER_INDEX.setdefault(_ticker, (_name, _confidence))
+
+_TICKER_RE = re.compile(r'\b(\d{6})\b')
+
+
+def _best_exact_match(normalized_text: str) -> tuple[tuple[int, int], str, str, str, float] | None:
+    if _AUTOMATON is not None:
+        hits = (entry for _, entry in _AUTOMATON.iter(normalized_text))
+    else:
+        hits = (_EXACT_INDEX[m.group(1)] for m in _EXACT_RE.finditer(normalized_text))
+    return min(hits, default=None)
+
+
 def map_ticker(text: str) -> MappingResult | None:
     """
     텍스트에서 종목명을 찾아 티커로 매핑합니다.
@@ -141,47 +211,56 @@ def map_ticker(text: str) -> MappingResult | None:
     Returns:
         MappingResult 또는 None (매핑 실패 시)
     """
+    return _resolve_mapping(text, _best_exact_match(_normalize(text)))
+
+
+def map_tickers_batch(texts: list[str]) -> list[MappingResult | None]:
+    """여러 텍스트를 한 번에 매핑합니다 (결과는 map_ticker와 동일, 입력 순서 유지).
+
+    오토마톤 사용 시 정규화 텍스트를 NUL 문자로 이어 붙여 한 번만 스캔한다.
+    """
+    normalized = [_normalize(t) for t in texts]
+    if _AUTOMATON is None:
+        bests = [_best_exact_match(nt) for nt in normalized]
+    else:
+        starts: list[int] = []
+        pos = 0
+        for nt in normalized:
+            starts.append(pos)
+            pos += len(nt) + 1
+        bests = [None] * len(texts)
+        for end, entry in _AUTOMATON.iter("\x00".join(normalized)):
+            i = bisect_right(starts, end) - 1
+            if bests[i] is None or entry < bests[i]:
+                bests[i] = entry
+    return [_resolve_mapping(t, best) for t, best in zip(texts, bests)]
+
+
+def _normalize(text: str) -> str:
     # 텍스트 정규화
-    normalized_text = text.lower().replace(" ", "")
-    lower_text = text.lower()
-    
+    # (alias 원문이 원문 텍스트에 있으면 공백 제거 형태도 반드시 포함되므로 정규화 텍스트만 스캔)
+    return text.lower().replace(" ", "")
+
+
+def _resolve_mapping(
+    text: str,
+    best: tuple[tuple[int, int], str, str, str, float] | None,
+) -> MappingResult | None:
     # 1. 정확한 매칭 시도 (긴 문자열 우선)
-    exact_matches = []
-    for alias, (ticker, name, confidence) in ALIASES.items():
-        if ticker == "":  # 애매한 매핑 스킵
-            continue
-        # 원문(공백 포함)과 정규화(공백 제거) 모두 시도
-        alias_lower = alias.lower()
-        alias_normalized = alias_lower.replace(" ", "")
-        if alias_lower in lower_text or alias_normalized in normalized_text:
-            exact_matches.append((len(alias), alias, ticker, name, confidence))
-    
-    if exact_matches:
-        # 가장 긴 정확한 매칭 선택
-        exact_matches.sort(reverse=True, key=lambda x: x[0])
-        _, alias, ticker, name, confidence = exact_matches[0]
-        
+    if best is not None:
+        _, alias, ticker, name, confidence = best
+
         # 애매한 매핑 차단: 매칭된 alias 자체가 짧은 애매한 키워드인 경우만 차단
         # (예: "SK"가 매칭되면 차단, "SK하이닉스"가 매칭되면 통과)
-        ambiguous_short_forms = {"삼성", "현대", "LG", "SK"}
-        is_ambiguous = alias in ambiguous_short_forms
-        
-        if not is_ambiguous:
+        if alias not in AMBIGUOUS_SHORT_FORMS:
             return MappingResult(ticker=ticker, company_name=name, confidence=confidence, method="exact_match")
-    
+
     # 2. 부분 매칭 시도 (신뢰도 낮춤)
-    for alias, (ticker, name, confidence) in ALIASES.items():
-        if ticker == "":
-            continue
-        
-        # 별도 처리: "삼성", "현대", "LG", "SK"는 부분 매칭에서 제외
-        if alias in ["삼성", "현대", "LG", "SK"]:
-            continue
-            
-        # 단어 경계를 고려한 부분 매칭
-        words = text.split()
+    # 단어 경계를 고려한 부분 매칭
+    words = text.split()
+    for alias, ticker, name, confidence in _PARTIAL_ALIASES:
         for word in words:
-            if alias in word and len(alias) >= 3:  # 최소 3글자 이상 매칭
+            if alias in word:
                 # 신뢰도 조정: 부분 매칭이므로 신뢰도 낮춤
                 adjusted_confidence = confidence * 0.7
                 return MappingResult(
@@ -192,19 +271,16 @@ def map_ticker(text: str) -> MappingResult | None:
                 )
     
     # 3. 티커 직접 검색 (예: "005930" 형태)
-    import re
-    ticker_pattern = r'\b(\d{6})\b'
-    ticker_matches = re.findall(ticker_pattern, text)
-    
-    for ticker_match in ticker_matches:
+    for ticker_match in _TICKER_RE.findall(text):
         # 알려진 티커인지 확인
-        for alias, (known_ticker, name, confidence) in ALIASES.items():
-            if known_ticker == ticker_match:
-                return MappingResult(
-                    ticker=known_ticker,
-                    company_name=name,
-                    confidence=confidence * 0.9,  # 티커 직접 매칭은 높은 신뢰도
-                    method="ticker_direct"
-                )
+        known = _TICKER_INDEX.get(ticker_match)
+        if known is not None:
+            name, confidence = known
+            return MappingResult(
+                ticker=ticker_match,
+                company_name=name,
+                confidence=confidence * 0.9,  # 티커 직접 매칭은 높은 신뢰도
+                method="ticker_direct"
+            )
     
     return None
@@ -2,7 +2,7 @@ import time
 
 from app.config import settings
 from app.scheduler.exit_runner import run_exit_cycle
-from app.storage.db import DB
+from app.storage.db_pool import DBPool
 from app.monitor.telegram_logger import log_and_notify
 
 
@@ -15,15 +15,26 @@ def run_exit_loop(db_path: str = "stock_trader.db", interval_sec: int | None = N
     iv = max(1, iv)
 
     log_and_notify(f"EXIT_LOOP_STARTED interval_sec={iv}")
-    while True:
-        try:
-            with DB(db_path) as db:
-                db.init()
-                out = run_exit_cycle(db)
-            log_and_notify(f"EXIT_LOOP_TICK {out}")
-        except Exception as e:
-            log_and_notify(f"EXIT_LOOP_ERROR:{e}")
-        time.sleep(iv)
+    # 틱마다 연결/스키마 초기화를 반복하지 않도록 연결을 재사용 (오류 시 다음 틱에 재생성)
+    pool: DBPool | None = None
+    try:
+        while True:
+            try:
+                if pool is None:
+                    pool = DBPool(db_path, ro_size=0)
+                with pool.rw() as db:
+                    db.refresh_parameter_cache()
+                    out = run_exit_cycle(db)
+                log_and_notify(f"EXIT_LOOP_TICK {out}")
+            except Exception as e:
+                log_and_notify(f"EXIT_LOOP_ERROR:{e}")
+                if pool is not None:
+                    pool.close()
+                    pool = None
+            time.sleep(iv)
+    finally:
+        if pool is not None:
+            pool.close()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,13 @@
-import json
 from typing import TypedDict
 
 from app.config import settings
 from app.ingestion.news_feed import NewsFetchError, build_hash, fetch_rss_news_items, sample_news
-from app.nlp.ticker_mapper import MappingResult, map_ticker
+from app.nlp.ticker_mapper import MappingResult, map_ticker, map_tickers_batch
 from app.signal.decision import derive_signal_fields
 from app.signal.integrity import EventTicker, validate_signal_binding
 from app.signal.scorer import ScoreInput, compute_scores
 from app.signal.technical import compute_technical_score
-from app.storage.db import DB
+from app.storage.db import DB, dumps_json
 
 
 class SignalBundle(TypedDict):
@@ -22,10 +21,8 @@ def _load_news_item(log_and_notify) -> object | None:
         try:
             items = fetch_rss_news_items(settings.news_rss_url, limit=10)
             # 매핑 가능한 뉴스만 필터링
-            mappable_items = []
-            for n in items:
-                if map_ticker((n.title or "") + " " + (n.body or "")):
-                    mappable_items.append(n)
+            mappings = map_tickers_batch([(n.title or "") + " " + (n.body or "") for n in items])
+            mappable_items = [n for n, m in zip(items, mappings) if m]
             
             if mappable_items:
                 # 매핑 가능한 첫 번째 뉴스 반환
@@ -90,9 +87,9 @@ def ingest_and_create_signal(db: DB, log_and_notify) -> SignalBundle | None:
             return None
 
         event_ticker = EventTicker(
-            id=int(row["id"]),
-            news_id=int(row["news_id"]),
-            map_confidence=float(row["map_confidence"]),
+            id=row["id"],
+            news_id=row["news_id"],
+            map_confidence=row["map_confidence"],
         )
         validate_signal_binding(input_news_id=news_id, event_ticker=event_ticker)
 
@@ -143,7 +140,7 @@ def ingest_and_create_signal(db: DB, log_and_notify) -> SignalBundle | None:
                 "ticker": mapping.ticker,
                 "raw_score": raw_score,
                 "total_score": total_score,
-                "components": json.dumps(components, ensure_ascii=False),
+                "components": dumps_json(components),
                 "priced_in_flag": priced_in_flag,
                 "decision": decision,
             },
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreInput:
     impact: float
     source_reliability: float
@@ -24,15 +24,39 @@ DEFAULT_WEIGHTS = {
 }
 
 
-def compute_scores(inp: ScoreInput, weights: dict[str, float] | None = None) -> tuple[float, float]:
-    w = {**DEFAULT_WEIGHTS, **(weights or {})}
+_WEIGHT_KEYS = ("impact", "source_reliability", "novelty", "market_reaction", "liquidity")
+_DEFAULT_WEIGHT_VECTOR = tuple(DEFAULT_WEIGHTS[k] for k in _WEIGHT_KEYS)
+
+
+def _weight_vector(weights: dict[str, float] | None) -> tuple[float, ...]:
+    # 기본 가중치 위에 전달된 가중치를 덮어쓴 결과 (dict 병합 없이 튜플로)
+    if not weights:
+        return _DEFAULT_WEIGHT_VECTOR
+    return tuple(weights.get(k, DEFAULT_WEIGHTS[k]) for k in _WEIGHT_KEYS)
+
+
+def _score(inp: ScoreInput, w: tuple[float, ...]) -> tuple[float, float]:
+    w_impact, w_source, w_novelty, w_reaction, w_liquidity = w
     raw_score = (
-        w["impact"] * inp.impact
-        + w["source_reliability"] * inp.source_reliability
-        + w["novelty"] * inp.novelty
-        + w["market_reaction"] * inp.market_reaction
-        + w["liquidity"] * inp.liquidity
+        w_impact * inp.impact
+        + w_source * inp.source_reliability
+        + w_novelty * inp.novelty
+        + w_reaction * inp.market_reaction
+        + w_liquidity * inp.liquidity
         - inp.risk_penalty
     )
     total_score = clamp(raw_score, 0.0, 100.0)
     return raw_score, total_score
+
+
+def compute_scores(inp: ScoreInput, weights: dict[str, float] | None = None) -> tuple[float, float]:
+    return _score(inp, _weight_vector(weights))
+
+
+def compute_scores_batch(
+    inputs: list[ScoreInput],
+    weights: dict[str, float] | None = None,
+) -> list[tuple[float, float]]:
+    """여러 입력을 같은 가중치로 점수화 (가중치 해석은 한 번만)."""
+    w = _weight_vector(weights)
+    return [_score(inp, w) for inp in inputs]
@@ -1,8 +1,209 @@
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 import json
 
+try:
+    import orjson  # optional: 파라미터/이벤트 JSON 직렬화 가속
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps_json(obj: Any) -> bytes:
+    """이벤트/신호 payload를 compact JSON(UTF-8 bytes)으로 직렬화해 BLOB 컬럼에 그대로 저장.
+
+    orjson이 있으면 사용하고, 없으면 같은 형태의 json.dumps 결과를 인코딩한다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(raw: str | bytes) -> Any:
+    """dumps_json 결과(또는 예전 text 컬럼 값) 역직렬화."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# init()에서 executescript로 한 번에 실행하는 스키마 + 기본 파라미터 시드
+_SCHEMA_SQL = """
+begin;
+create table if not exists news_events (
+  id integer primary key autoincrement,
+  source text not null,
+  tier integer not null check (tier in (1,2,3)),
+  published_at text not null,
+  title text not null,
+  body text,
+  url text unique,
+  raw_hash text not null unique,
+  ingested_at text default current_timestamp
+);
+create table if not exists event_tickers (
+  id integer primary key autoincrement,
+  news_id integer not null,
+  ticker text not null,
+  company_name text,
+  map_confidence real not null,
+  mapping_method text not null,
+  context_snippet text,
+  created_at text default current_timestamp
+);
+create table if not exists signal_scores (
+  id integer primary key autoincrement,
+  news_id integer not null,
+  event_ticker_id integer not null,
+  ticker text not null,
+  raw_score real not null,
+  total_score real not null check (total_score >= 0 and total_score <= 100),
+  components blob not null,
+  priced_in_flag text not null check (priced_in_flag in ('LOW','MEDIUM','HIGH')),
+  decision text not null check (decision in ('BUY','HOLD','IGNORE','BLOCK')),
+  created_at text default current_timestamp
+);
+create table if not exists positions (
+  position_id integer primary key autoincrement,
+  ticker text not null,
+  signal_id integer,
+  status text not null check (status in ('PENDING_ENTRY','OPEN','PARTIAL_EXIT','CLOSED','CANCELLED')),
+  qty real not null default 0,
+  exited_qty real not null default 0,
+  avg_entry_price real,
+  opened_value real,
+  high_watermark real,
+  leverage real not null default 1.0,
+  opened_at text default current_timestamp,
+  closed_at text,
+  exit_reason_code text
+);
+create table if not exists orders (
+  id integer primary key autoincrement,
+  position_id integer,
+  signal_id integer,
+  ticker text not null,
+  side text not null check (side in ('BUY','SELL')),
+  qty real not null,
+  order_type text not null check (order_type in ('MARKET','LIMIT','STOP','STOP_LIMIT')),
+  price real,
+  filled_qty real not null default 0,
+  status text not null check (status in ('NEW','SENT','PARTIAL_FILLED','FILLED','CANCELLED','REJECTED','EXPIRED')),
+  broker_order_id text,
+  attempt_no integer not null default 1,
+  sent_at text default current_timestamp,
+  filled_at text,
+  created_at text default current_timestamp
+);
+create table if not exists position_events (
+  id integer primary key autoincrement,
+  position_id integer not null,
+  event_time text default current_timestamp,
+  event_type text not null check (event_type in ('ENTRY','ADD','PARTIAL_EXIT','FULL_EXIT','BLOCK')),
+  action text not null check (action in ('EXECUTED','SKIPPED','BLOCKED')),
+  reason_code text not null,
+  detail_json blob not null,
+  idempotency_key text unique
+);
+create table if not exists risk_state (
+  trade_date text primary key,
+  daily_realized_pnl real not null default 0,
+  daily_unrealized_pnl real not null default 0,
+  daily_loss_limit_hit integer not null default 0,
+  consecutive_losses integer not null default 0,
+  cooldown_until text,
+  trading_enabled integer not null default 1,
+  updated_at text default current_timestamp
+);
+create table if not exists parameter_registry (
+  id integer primary key autoincrement,
+  name text unique not null,
+  value_json text not null,
+  scope text not null,
+  tune_required integer not null default 1,
+  target_phase text,
+  rationale text,
+  evidence_link text,
+  updated_at text default current_timestamp
+);
+create index if not exists idx_signal_scores_ticker on signal_scores (ticker);
+create index if not exists idx_positions_signal_id on positions (signal_id);
+create index if not exists idx_positions_status on positions (status);
+create index if not exists idx_positions_ticker_status on positions (ticker, status);
+create index if not exists idx_orders_position_id on orders (position_id);
+create index if not exists idx_position_events_position_id on position_events (position_id);
+insert or ignore into parameter_registry(name, value_json, scope, tune_required, target_phase, rationale)
+values('score_weights', '{"impact":0.30,"source_reliability":0.20,"novelty":0.20,"market_reaction":0.15,"liquidity":0.15}', 'global', 0, null, 'v1.2.3 base');
+insert or ignore into parameter_registry(name, value_json, scope, tune_required, target_phase, rationale)
+values('retry_policy', '{"max_attempts_per_signal":2,"min_retry_interval_sec":30}', 'global', 0, null, 'v1.2.3 base');
+insert or ignore into parameter_registry(name, value_json, scope, tune_required, target_phase, rationale)
+values('exit_policy', '{"time_exit_min":15,"trailing_arm_pct":0.005,"trailing_gap_pct":0.003,"opposite_exit_score_threshold":70}', 'global', 0, null, 'v1.2.3 base');
+commit;
+"""
+
+
+# 핫패스 SQL: 동일 텍스트를 재사용해 연결별 statement 캐시 적중을 보장
+_SQL_INSERT_NEWS = """
+insert into news_events(source,tier,published_at,title,body,url,raw_hash)
+values(?,?,?,?,?,?,?)
+"""
+_SQL_INSERT_EVENT_TICKER = """
+insert into event_tickers(news_id,ticker,company_name,map_confidence,mapping_method)
+values(?,?,?,?,?)
+"""
+_SQL_INSERT_SIGNAL = """
+insert into signal_scores(news_id,event_ticker_id,ticker,raw_score,total_score,components,priced_in_flag,decision)
+values(?,?,?,?,?,?,?,?)
+"""
+_SQL_SET_POSITION_OPEN = """
+update positions
+set status='OPEN', avg_entry_price=?, opened_value=?, high_watermark=coalesce(high_watermark, ?)
+where position_id=? and status='PENDING_ENTRY'
+returning position_id, status, avg_entry_price, opened_value
+"""
+_SQL_SET_POSITION_CLOSED = """
+update positions
+set status='CLOSED', closed_at=current_timestamp, exit_reason_code=?, exited_qty=coalesce(?, exited_qty)
+where position_id=? and status in ('OPEN','PARTIAL_EXIT')
+returning position_id, status, exit_reason_code, exited_qty, closed_at
+"""
+_SQL_INSERT_ORDER = """
+insert into orders(position_id,signal_id,ticker,side,qty,order_type,status,price,attempt_no)
+values(?,?,?,?,?,?,?,?,?)
+"""
+_SQL_UPDATE_ORDER_FILLED = """
+update orders
+set status='FILLED',
+    price=?,
+    filled_qty=coalesce(?, qty),
+    filled_at=current_timestamp,
+    broker_order_id=coalesce(?, broker_order_id)
+where id=? and status in ('NEW','SENT','PARTIAL_FILLED')
+"""
+_SQL_INSERT_POSITION_EVENT = """
+insert into position_events(position_id,event_type,action,reason_code,detail_json,idempotency_key)
+values(?,?,?,?,?,?)
+"""
+_SQL_INSERT_POSITION_EVENT_SKIP_DUP = _SQL_INSERT_POSITION_EVENT + "on conflict(idempotency_key) do nothing\n"
+_SQL_OPEN_POSITION_STATS = """
+select count(*), coalesce(sum(case when ticker=? then coalesce(opened_value, 0) end), 0)
+from positions
+where status in ('OPEN','PARTIAL_EXIT')
+"""
+
+
+def _signal_row(payload: dict[str, Any]) -> tuple:
+    return (
+        payload["news_id"],
+        payload["event_ticker_id"],
+        payload["ticker"],
+        payload["raw_score"],
+        payload["total_score"],
+        payload["components"],
+        payload["priced_in_flag"],
+        payload["decision"],
+    )
+
 
 class IllegalTransitionError(RuntimeError):
     """Raised when position status transition is not allowed."""
@@ -15,13 +216,41 @@ class DB:
     This sqlite adapter is for quick local integration only.
     """
 
-    def __init__(self, path: str = "stock_trader.db") -> None:
-        self.path = Path(path)
-        self.conn = sqlite3.connect(self.path)
+    dumps_json = staticmethod(dumps_json)
+    loads_json = staticmethod(loads_json)
+
+    def __init__(self, path: str = "stock_trader.db", read_only: bool = False) -> None:
+        # sqlite3.connect는 문자열 경로를 그대로 받으므로 Path 변환은 필요할 때만 (path_obj)
+        self.path = str(path)
+        self.read_only = read_only
+        # 컴파일된 statement는 연결 단위 LRU 캐시(SQL 텍스트 키)로 재사용
+        if read_only:
+            self.conn = sqlite3.connect(f"{self.path_obj.resolve().as_uri()}?mode=ro", uri=True, cached_statements=256)
+        else:
+            self.conn = sqlite3.connect(self.path, cached_statements=256)
+        # 암묵적 BEGIN 없이 begin()에서만 트랜잭션을 연다 (그 밖의 문장은 즉시 커밋)
+        self.conn.isolation_level = None
         self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA journal_mode=WAL")
+        # 인메모리 DB는 WAL을 지원하지 않으므로 MEMORY 저널 사용 (읽기 전용 연결은 파일 설정을 따름)
+        if self.path == ":memory:" or self.path.startswith("file::memory:"):
+            self.conn.execute("PRAGMA journal_mode=MEMORY")
+        elif not read_only:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL에서는 NORMAL로도 커밋 단위 일관성 유지 (체크포인트 시점에만 fsync)
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+        self.conn.execute("PRAGMA mmap_size=268435456")
         self.conn.execute("PRAGMA busy_timeout=5000")
         self._transaction_depth = 0  # 트랜잭션 중첩 깊이 추적
+        # 결과를 즉시 소비하는 쓰기 경로 전용 공유 커서 (조회용으로 넘겨주지 않음)
+        self._wcur = self.conn.cursor()
+        self._param_cache: dict[str, Any] = {}
+        self._param_cache_version: int | None = None
+
+    @property
+    def path_obj(self) -> Path:
+        return Path(self.path)
 
     def __enter__(self) -> "DB":
         return self
@@ -33,179 +262,58 @@ class DB:
 
     def begin(self) -> None:
         if self._transaction_depth == 0:
-            self.conn.execute("BEGIN")
+            # 쓰기 잠금을 시작 시점에 확보해 읽기->쓰기 승격 중 SQLITE_BUSY 교착을 피함
+            self.conn.execute("BEGIN IMMEDIATE")
+        else:
+            # 중첩 begin은 SAVEPOINT로 열어 내부 실패가 외부 트랜잭션을 끝내지 않게 함
+            self.conn.execute(f"SAVEPOINT sp_{self._transaction_depth}")
         self._transaction_depth += 1
 
     def commit(self) -> None:
         if self._transaction_depth > 0:
             self._transaction_depth -= 1
             if self._transaction_depth == 0:
-                self.conn.commit()
+                self.conn.execute("COMMIT")
+            else:
+                self.conn.execute(f"RELEASE sp_{self._transaction_depth}")
         else:
             # 트랜잭션이 시작되지 않았는데 commit 호출
             pass
 
     def rollback(self) -> None:
         if self._transaction_depth > 0:
-            self._transaction_depth = 0
-            self.conn.rollback()
+            # 취소된 트랜잭션 안에서 캐시된 파라미터 값이 남지 않도록 비움
+            self._param_cache.clear()
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.execute("ROLLBACK")
+            else:
+                # 해당 중첩 단계만 취소하고 외부 트랜잭션은 유지
+                self.conn.execute(f"ROLLBACK TO sp_{self._transaction_depth}")
+                self.conn.execute(f"RELEASE sp_{self._transaction_depth}")
         else:
             # 트랜잭션이 시작되지 않았는데 rollback 호출
             pass
 
+    def _end_atomic(self, autocommit: bool) -> None:
+        """자체 begin()으로 묶은 헬퍼의 마무리.
+
+        중첩 단계(SAVEPOINT)는 항상 해제하고, 최상위 트랜잭션은 autocommit일 때만 커밋한다
+        (autocommit=False면 호출자가 commit/rollback 할 때까지 열어 둔다).
+        """
+        if autocommit or self._transaction_depth > 1:
+            self.commit()
+
     def close(self) -> None:
         self.conn.close()
 
     def init(self) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            create table if not exists news_events (
-              id integer primary key autoincrement,
-              source text not null,
-              tier integer not null check (tier in (1,2,3)),
-              published_at text not null,
-              title text not null,
-              body text,
-              url text unique,
-              raw_hash text not null unique,
-              ingested_at text default current_timestamp
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists event_tickers (
-              id integer primary key autoincrement,
-              news_id integer not null,
-              ticker text not null,
-              company_name text,
-              map_confidence real not null,
-              mapping_method text not null,
-              context_snippet text,
-              created_at text default current_timestamp
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists signal_scores (
-              id integer primary key autoincrement,
-              news_id integer not null,
-              event_ticker_id integer not null,
-              ticker text not null,
-              raw_score real not null,
-              total_score real not null check (total_score >= 0 and total_score <= 100),
-              components text not null,
-              priced_in_flag text not null check (priced_in_flag in ('LOW','MEDIUM','HIGH')),
-              decision text not null check (decision in ('BUY','HOLD','IGNORE','BLOCK')),
-              created_at text default current_timestamp
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists positions (
-              position_id integer primary key autoincrement,
-              ticker text not null,
-              signal_id integer,
-              status text not null check (status in ('PENDING_ENTRY','OPEN','PARTIAL_EXIT','CLOSED','CANCELLED')),
-              qty real not null default 0,
-              exited_qty real not null default 0,
-              avg_entry_price real,
-              opened_value real,
-              high_watermark real,
-              leverage real not null default 1.0,
-              opened_at text default current_timestamp,
-              closed_at text,
-              exit_reason_code text
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists orders (
-              id integer primary key autoincrement,
-              position_id integer,
-              signal_id integer,
-              ticker text not null,
-              side text not null check (side in ('BUY','SELL')),
-              qty real not null,
-              order_type text not null check (order_type in ('MARKET','LIMIT','STOP','STOP_LIMIT')),
-              price real,
-              filled_qty real not null default 0,
-              status text not null check (status in ('NEW','SENT','PARTIAL_FILLED','FILLED','CANCELLED','REJECTED','EXPIRED')),
-              broker_order_id text,
-              attempt_no integer not null default 1,
-              sent_at text default current_timestamp,
-              filled_at text,
-              created_at text default current_timestamp
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists position_events (
-              id integer primary key autoincrement,
-              position_id integer not null,
-              event_time text default current_timestamp,
-              event_type text not null check (event_type in ('ENTRY','ADD','PARTIAL_EXIT','FULL_EXIT','BLOCK')),
-              action text not null check (action in ('EXECUTED','SKIPPED','BLOCKED')),
-              reason_code text not null,
-              detail_json text not null,
-              idempotency_key text unique
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists risk_state (
-              trade_date text primary key,
-              daily_realized_pnl real not null default 0,
-              daily_unrealized_pnl real not null default 0,
-              daily_loss_limit_hit integer not null default 0,
-              consecutive_losses integer not null default 0,
-              cooldown_until text,
-              trading_enabled integer not null default 1,
-              updated_at text default current_timestamp
-            )
-            """
-        )
-        cur.execute(
-            """
-            create table if not exists parameter_registry (
-              id integer primary key autoincrement,
-              name text unique not null,
-              value_json text not null,
-              scope text not null,
-              tune_required integer not null default 1,
-              target_phase text,
-              rationale text,
-              evidence_link text,
-              updated_at text default current_timestamp
-            )
-            """
-        )
-        cur.execute(
-            """
-            insert or ignore into parameter_registry(name, value_json, scope, tune_required, target_phase, rationale)
-            values('score_weights', '{"impact":0.30,"source_reliability":0.20,"novelty":0.20,"market_reaction":0.15,"liquidity":0.15}', 'global', 0, null, 'v1.2.3 base')
-            """
-        )
-        cur.execute(
-            """
-            insert or ignore into parameter_registry(name, value_json, scope, tune_required, target_phase, rationale)
-            values('retry_policy', '{"max_attempts_per_signal":2,"min_retry_interval_sec":30}', 'global', 0, null, 'v1.2.3 base')
-            """
-        )
-        cur.execute(
-            """
-            insert or ignore into parameter_registry(name, value_json, scope, tune_required, target_phase, rationale)
-            values('exit_policy', '{"time_exit_min":15,"trailing_arm_pct":0.005,"trailing_gap_pct":0.003,"opposite_exit_score_threshold":70}', 'global', 0, null, 'v1.2.3 base')
-            """
-        )
+        # 스키마/시드 전체를 한 번의 스크립트 실행(단일 트랜잭션)으로 처리
+        self.conn.executescript(_SCHEMA_SQL)
+        self._param_cache.clear()
 
         # lightweight migration for old local sqlite files
+        # (components/detail_json이 text로 선언된 예전 파일도 BLOB 값은 변환 없이 저장되므로 별도 처리 불필요)
         try:
             cols = [r[1] for r in self.conn.execute("pragma table_info(orders)").fetchall()]
             if "filled_qty" not in cols:
@@ -237,11 +345,28 @@ class DB:
 
     def get_risk_state(self, trade_date: str) -> dict[str, Any] | None:
         cur = self.conn.cursor()
-        cur.execute("select * from risk_state where trade_date=?", (trade_date,))
+        cur.execute(
+            """
+            select trade_date, daily_realized_pnl, daily_unrealized_pnl, daily_loss_limit_hit,
+                   consecutive_losses, cooldown_until, trading_enabled
+            from risk_state where trade_date=?
+            """,
+            (trade_date,),
+        )
         row = cur.fetchone()
         return dict(row) if row else None
 
     def apply_realized_pnl(self, trade_date: str, pnl_delta: float, autocommit: bool = True) -> None:
+        # 조회 후 갱신이므로 한 트랜잭션으로 묶음 (외부 트랜잭션이 있으면 그 안에 중첩)
+        self.begin()
+        try:
+            self._apply_realized_pnl(trade_date, pnl_delta)
+        except Exception:
+            self.rollback()
+            raise
+        self._end_atomic(autocommit)
+
+    def _apply_realized_pnl(self, trade_date: str, pnl_delta: float) -> None:
         self.ensure_risk_state_today(trade_date, autocommit=False)
         cur = self.conn.cursor()
         
@@ -282,9 +407,6 @@ class DB:
                 """,
                 (float(pnl_delta or 0.0), new_consecutive_losses, trade_date),
             )
-        
-        if autocommit and self._transaction_depth == 0:
-            self.conn.commit()
     
     def _get_loss_streak_cooldown(self) -> int:
         """리스크 설정에서 loss_streak_cooldown 값을 가져옵니다."""
@@ -297,15 +419,45 @@ class DB:
         return max(1, int(settings.risk_cooldown_minutes or 60))
 
     def get_parameter(self, name: str) -> dict[str, Any] | None:
+        """parameter_registry 값을 파싱해 연결 단위로 캐시 (반환 dict는 수정하지 말 것).
+
+        캐시는 init()/set_parameter()에서 비우고, 다른 프로세스의 변경은
+        refresh_parameter_cache()를 주기마다 한 번 호출해 반영한다.
+        """
+        if name in self._param_cache:
+            return self._param_cache[name]
+
         cur = self.conn.cursor()
         cur.execute("select value_json from parameter_registry where name=?", (name,))
         row = cur.fetchone()
-        if not row:
-            return None
-        try:
-            return json.loads(row["value_json"])
-        except Exception:
-            return None
+        value = None
+        if row:
+            try:
+                value = loads_json(row["value_json"])
+            except Exception:
+                value = None
+        self._param_cache[name] = value
+        return value
+
+    def set_parameter(self, name: str, value: dict[str, Any], autocommit: bool = True) -> None:
+        cur = self.conn.cursor()
+        cur.execute(
+            "update parameter_registry set value_json=? where name=?",
+            (dumps_json(value).decode(), name),
+        )
+        self._param_cache.pop(name, None)
+        if autocommit and self._transaction_depth == 0:
+            self.conn.commit()
+
+    def refresh_parameter_cache(self) -> None:
+        """다른 연결이 커밋했으면(PRAGMA data_version 변경) 파라미터 캐시를 비움.
+
+        조회마다가 아니라 루프 주기마다 한 번 호출한다.
+        """
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._param_cache_version:
+            self._param_cache.clear()
+            self._param_cache_version = version
 
     def get_score_weights(self) -> dict[str, float] | None:
         raw = self.get_parameter("score_weights")
@@ -357,14 +509,22 @@ class DB:
             "opposite_exit_score_threshold": max(0.0, opposite_exit_score_threshold),
         }
 
+    def news_exists(self, url: str | None, raw_hash: str) -> bool:
+        """url 또는 raw_hash가 이미 적재됐는지 unique 인덱스로 확인."""
+        row = self.conn.execute(
+            "select 1 from news_events where raw_hash=? or url=? limit 1",
+            (raw_hash, url),
+        ).fetchone()
+        return row is not None
+
     def insert_news_if_new(self, item: dict[str, Any], autocommit: bool = True) -> int | None:
-        cur = self.conn.cursor()
+        # 중복 뉴스는 조회만으로 거르고(실패 INSERT/예외 비용 회피), 경합 시에만 IntegrityError로 처리
+        if self.news_exists(item["url"], item["raw_hash"]):
+            return None
+        cur = self._wcur
         try:
             cur.execute(
-                """
-                insert into news_events(source,tier,published_at,title,body,url,raw_hash)
-                values(?,?,?,?,?,?,?)
-                """,
+                _SQL_INSERT_NEWS,
                 (
                     item["source"],
                     item["tier"],
@@ -377,7 +537,7 @@ class DB:
             )
             if autocommit and self._transaction_depth == 0:
                 self.conn.commit()
-            return int(cur.lastrowid)
+            return cur.lastrowid
         except sqlite3.IntegrityError:
             return None
 
@@ -390,45 +550,44 @@ class DB:
         method: str,
         autocommit: bool = True,
     ) -> int:
-        cur = self.conn.cursor()
+        cur = self._wcur
         cur.execute(
-            """
-            insert into event_tickers(news_id,ticker,company_name,map_confidence,mapping_method)
-            values(?,?,?,?,?)
-            """,
+            _SQL_INSERT_EVENT_TICKER,
             (news_id, ticker, company_name, confidence, method),
         )
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
-        return int(cur.lastrowid)
+        return cur.lastrowid
 
-    def get_event_ticker(self, event_ticker_id: int) -> dict[str, Any] | None:
+    def get_event_ticker(self, event_ticker_id: int) -> sqlite3.Row | None:
+        # Row는 키/인덱스 접근을 모두 지원하므로 dict로 복사하지 않고 그대로 반환
         cur = self.conn.cursor()
-        cur.execute("select * from event_tickers where id=?", (event_ticker_id,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        cur.execute(
+            "select id, news_id, ticker, company_name, map_confidence, mapping_method from event_tickers where id=?",
+            (event_ticker_id,),
+        )
+        return cur.fetchone()
 
     def insert_signal(self, payload: dict[str, Any], autocommit: bool = True) -> int:
-        cur = self.conn.cursor()
+        cur = self._wcur
         cur.execute(
-            """
-            insert into signal_scores(news_id,event_ticker_id,ticker,raw_score,total_score,components,priced_in_flag,decision)
-            values(?,?,?,?,?,?,?,?)
-            """,
-            (
-                payload["news_id"],
-                payload["event_ticker_id"],
-                payload["ticker"],
-                payload["raw_score"],
-                payload["total_score"],
-                payload["components"],
-                payload["priced_in_flag"],
-                payload["decision"],
-            ),
+            _SQL_INSERT_SIGNAL,
+            _signal_row(payload),
+        )
+        if autocommit and self._transaction_depth == 0:
+            self.conn.commit()
+        return cur.lastrowid
+
+    def insert_signals_many(self, payloads: list[dict[str, Any]], autocommit: bool = True) -> int:
+        """여러 신호를 executemany 한 번으로 적재. Returns: 삽입된 행 수"""
+        cur = self._wcur
+        cur.executemany(
+            _SQL_INSERT_SIGNAL,
+            [_signal_row(p) for p in payloads],
         )
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
-        return int(cur.lastrowid)
+        return cur.rowcount
 
     def create_position(self, ticker: str, signal_id: int, qty: float, autocommit: bool = True) -> int:
         cur = self.conn.cursor()
@@ -441,22 +600,23 @@ class DB:
         )
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
-        return int(cur.lastrowid)
+        return cur.lastrowid
 
-    def set_position_open(self, position_id: int, avg_entry_price: float, opened_value: float, autocommit: bool = True) -> None:
+    def set_position_open(
+        self, position_id: int, avg_entry_price: float, opened_value: float, autocommit: bool = True
+    ) -> sqlite3.Row:
+        """PENDING_ENTRY -> OPEN. 전이 확인과 결과 조회를 UPDATE ... RETURNING 한 번으로 처리."""
         cur = self.conn.cursor()
         cur.execute(
-            """
-            update positions
-            set status='OPEN', avg_entry_price=?, opened_value=?, high_watermark=coalesce(high_watermark, ?)
-            where position_id=? and status='PENDING_ENTRY'
-            """,
+            _SQL_SET_POSITION_OPEN,
             (avg_entry_price, opened_value, avg_entry_price, position_id),
         )
-        if cur.rowcount == 0:
+        rows = cur.fetchall()
+        if not rows:
             raise IllegalTransitionError(f"Invalid transition to OPEN for position_id={position_id}")
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
+        return rows[0]
 
     def set_position_partial_exit(self, position_id: int, exited_qty: float, autocommit: bool = True) -> None:
         cur = self.conn.cursor()
@@ -499,20 +659,21 @@ class DB:
         v = row[0]
         return float(v) if v is not None else None
 
-    def set_position_closed(self, position_id: int, reason_code: str, exited_qty: float | None = None, autocommit: bool = True) -> None:
+    def set_position_closed(
+        self, position_id: int, reason_code: str, exited_qty: float | None = None, autocommit: bool = True
+    ) -> sqlite3.Row:
+        """OPEN/PARTIAL_EXIT -> CLOSED. 갱신된 행을 RETURNING으로 받아 반환."""
         cur = self.conn.cursor()
         cur.execute(
-            """
-            update positions
-            set status='CLOSED', closed_at=current_timestamp, exit_reason_code=?, exited_qty=coalesce(?, exited_qty)
-            where position_id=? and status in ('OPEN','PARTIAL_EXIT')
-            """,
+            _SQL_SET_POSITION_CLOSED,
             (reason_code, exited_qty, position_id),
         )
-        if cur.rowcount == 0:
+        rows = cur.fetchall()
+        if not rows:
             raise IllegalTransitionError(f"Invalid transition to CLOSED for position_id={position_id}")
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
+        return rows[0]
 
     def set_position_cancelled(self, position_id: int, reason_code: str, autocommit: bool = True) -> None:
         cur = self.conn.cursor()
@@ -542,17 +703,14 @@ class DB:
         attempt_no: int = 1,
         autocommit: bool = True,
     ) -> int:
-        cur = self.conn.cursor()
+        cur = self._wcur
         cur.execute(
-            """
-            insert into orders(position_id,signal_id,ticker,side,qty,order_type,status,price,attempt_no)
-            values(?,?,?,?,?,?,?,?,?)
-            """,
+            _SQL_INSERT_ORDER,
             (position_id, signal_id, ticker, side, qty, order_type, status, price, int(attempt_no or 1)),
         )
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
-        return int(cur.lastrowid)
+        return cur.lastrowid
 
     def update_order_status(
         self,
@@ -614,17 +772,9 @@ class DB:
         broker_order_id: str | None = None,
         autocommit: bool = True,
     ) -> None:
-        cur = self.conn.cursor()
+        cur = self._wcur
         cur.execute(
-            """
-            update orders
-            set status='FILLED',
-                price=?,
-                filled_qty=coalesce(?, qty),
-                filled_at=current_timestamp,
-                broker_order_id=coalesce(?, broker_order_id)
-            where id=? and status in ('NEW','SENT','PARTIAL_FILLED')
-            """,
+            _SQL_UPDATE_ORDER_FILLED,
             (price, filled_qty, broker_order_id, order_id),
         )
         if cur.rowcount == 0:
@@ -632,6 +782,79 @@ class DB:
         if autocommit and self._transaction_depth == 0:
             self.conn.commit()
 
+    def insert_filled_order(
+        self,
+        position_id: int,
+        signal_id: int,
+        ticker: str,
+        side: str,
+        qty: float,
+        order_type: str,
+        price: float,
+        broker_order_id: str | None = None,
+        attempt_no: int = 1,
+        autocommit: bool = True,
+    ) -> int:
+        """즉시 체결된 주문을 FILLED 상태로 한 번에 기록 (insert SENT + update FILLED 대체)."""
+        cur = self._wcur
+        cur.execute(
+            """
+            insert into orders(position_id,signal_id,ticker,side,qty,order_type,status,price,filled_qty,broker_order_id,attempt_no,filled_at)
+            values(?,?,?,?,?,?,'FILLED',?,?,?,?,current_timestamp)
+            """,
+            (position_id, signal_id, ticker, side, qty, order_type, price, qty, broker_order_id, int(attempt_no or 1)),
+        )
+        if autocommit and self._transaction_depth == 0:
+            self.conn.commit()
+        return cur.lastrowid
+
+    def record_entry_fill(
+        self,
+        position_id: int,
+        order_id: int,
+        price: float,
+        opened_value: float,
+        detail_json: str | bytes,
+        idempotency_key: str | None = None,
+        filled_qty: float | None = None,
+        broker_order_id: str | None = None,
+        autocommit: bool = True,
+    ) -> int | None:
+        """진입 체결 반영(주문 FILLED -> 포지션 OPEN -> ENTRY 이벤트)을 커서 하나로 처리.
+
+        Returns: ENTRY 이벤트 id (idempotency key 충돌 시 None)
+        """
+        # 세 문장이 모두 반영되거나 모두 취소되도록 묶음 (외부 트랜잭션이 있으면 그 안에 중첩)
+        self.begin()
+        try:
+            cur = self._wcur
+            cur.execute(
+                _SQL_UPDATE_ORDER_FILLED,
+                (price, filled_qty, broker_order_id, order_id),
+            )
+            if cur.rowcount == 0:
+                raise IllegalTransitionError(f"Invalid transition to FILLED for order_id={order_id}")
+            cur.execute(
+                _SQL_SET_POSITION_OPEN,
+                (price, opened_value, price, position_id),
+            )
+            if not cur.fetchall():
+                raise IllegalTransitionError(f"Invalid transition to OPEN for position_id={position_id}")
+            cur.execute(
+                """
+                insert into position_events(position_id,event_type,action,reason_code,detail_json,idempotency_key)
+                values(?,'ENTRY','EXECUTED','ENTRY_FILLED',?,?)
+                on conflict(idempotency_key) do nothing
+                """,
+                (position_id, detail_json, idempotency_key),
+            )
+            event_id = cur.lastrowid if cur.rowcount else None
+        except Exception:
+            self.rollback()
+            raise
+        self._end_atomic(autocommit)
+        return event_id
+
     def get_order_status(self, order_id: int) -> str | None:
         cur = self.conn.cursor()
         cur.execute("select status from orders where id=?", (order_id,))
@@ -693,6 +916,13 @@ class DB:
         row = cur.fetchone()
         return float(row[0] or 0.0) if row else 0.0
 
+    def get_open_position_stats(self, ticker: str) -> tuple[int, float]:
+        """리스크 게이트 입력(전체 보유 포지션 수, 종목 노출액)을 한 번의 조회로 반환."""
+        cur = self.conn.cursor()
+        cur.row_factory = None  # 스칼라 두 개뿐이므로 Row 객체 생성 생략
+        count, exposure = cur.execute(_SQL_OPEN_POSITION_STATS, (ticker,)).fetchone()
+        return int(count), float(exposure)
+
     def get_positions_for_exit_scan(self, limit: int = 100) -> list[dict[str, Any]]:
         cur = self.conn.cursor()
         cur.execute(
@@ -753,28 +983,50 @@ class DB:
         rows = cur.fetchall()
         return [dict(r) for r in rows]
 
+    @contextmanager
+    def begin_event_batch(self) -> Iterator[list[tuple]]:
+        """position_events insert를 모았다가 블록 종료 시 executemany 한 번으로 기록.
+
+        블록 안에서 (position_id, event_type, action, reason_code, detail_json, idempotency_key)
+        튜플을 append 한다. idempotency key가 이미 있는 행은 insert_position_event와 같이
+        건너뛰고, 블록에서 예외가 나면 버린다. 호출자 트랜잭션이 있으면 그 안에서 기록만 하고
+        실패 시 롤백 여부는 호출자에게 맡긴다 (트랜잭션이 없을 때만 자체 begin/commit).
+        """
+        rows: list[tuple] = []
+        yield rows
+        if not rows:
+            return
+        owns_tx = self._transaction_depth == 0
+        if owns_tx:
+            self.begin()
+        try:
+            self._wcur.executemany(_SQL_INSERT_POSITION_EVENT_SKIP_DUP, rows)
+        except Exception:
+            if owns_tx:
+                self.rollback()
+            raise
+        if owns_tx:
+            self.commit()
+
     def insert_position_event(
         self,
         position_id: int,
         event_type: str,
         action: str,
         reason_code: str,
-        detail_json: str,
+        detail_json: str | bytes,
         idempotency_key: str | None = None,
         autocommit: bool = True,
     ) -> int | None:
-        cur = self.conn.cursor()
+        cur = self._wcur
         try:
             cur.execute(
-                """
-                insert into position_events(position_id,event_type,action,reason_code,detail_json,idempotency_key)
-                values(?,?,?,?,?,?)
-                """,
+                _SQL_INSERT_POSITION_EVENT,
                 (position_id, event_type, action, reason_code, detail_json, idempotency_key),
             )
             if autocommit and self._transaction_depth == 0:
                 self.conn.commit()
-            return int(cur.lastrowid)
+            return cur.lastrowid
         except sqlite3.IntegrityError:
             # idempotency key conflict
             return None
@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.storage.db import DB
+
+
+class DBPool:
+    """sqlite 연결 재사용 풀: 쓰기 연결 1개 + 읽기 전용 연결 최대 ro_size개.
+
+    rw()/ro()가 넘겨주는 DB는 닫지 않고 풀로 반환된다 (DB 자체를 with로 감싸지 말 것).
+    sqlite3 연결은 생성 스레드에 묶이므로 풀도 스레드 하나에서만 사용한다.
+    """
+
+    def __init__(self, path: str = "stock_trader.db", ro_size: int = 2, init_schema: bool = True) -> None:
+        self.path = path
+        self.ro_size = max(0, int(ro_size))
+        self._rw = DB(path)
+        if init_schema:
+            self._rw.init()
+        self._ro_idle: list[DB] = []
+        # 인메모리 DB는 연결마다 별도 DB이므로 읽기도 쓰기 연결을 공유
+        self._shared_only = path == ":memory:" or path.startswith("file::memory:")
+
+    def __enter__(self) -> "DBPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @contextmanager
+    def rw(self) -> Iterator[DB]:
+        try:
+            yield self._rw
+        except BaseException:
+            # 미완료 트랜잭션을 다음 사용자에게 넘기지 않음 (중첩 SAVEPOINT까지 모두 해제)
+            while self._rw._transaction_depth > 0:
+                self._rw.rollback()
+            raise
+
+    @contextmanager
+    def ro(self) -> Iterator[DB]:
+        if self._shared_only:
+            yield self._rw
+            return
+        db = self._ro_idle.pop() if self._ro_idle else DB(self.path, read_only=True)
+        try:
+            yield db
+        finally:
+            if len(self._ro_idle) < self.ro_size:
+                self._ro_idle.append(db)
+            else:
+                db.close()
+
+    def close(self) -> None:
+        while self._ro_idle:
+            self._ro_idle.pop().close()
+        self._rw.close()
@@ -1,40 +1,83 @@
-import json
 from app.storage.db import DB
 
+# parameter_registry(시드값)는 유지하고 나머지 테이블만 비움
+_RESET_SQL = """
+begin;
+delete from position_events;
+delete from orders;
+delete from positions;
+delete from signal_scores;
+delete from event_tickers;
+delete from news_events;
+delete from risk_state;
+delete from sqlite_sequence where name <> 'parameter_registry';
+commit;
+"""
+
+
+def reset_tables(db: DB) -> None:
+    """클래스 단위로 공유하는 DB를 테스트마다 초기 상태로 되돌림 (id 시퀀스 포함)."""
+    db.rollback()
+    db.conn.executescript(_RESET_SQL)
 
-def seed_signal(db: DB, *, url: str, raw_hash: str, title: str = "삼성전자 테스트") -> tuple[int, int, int]:
-    news_id = db.insert_news_if_new(
-        {
-            "source": "test",
-            "tier": 2,
-            "published_at": "2026-01-01T00:00:00+00:00",
-            "title": title,
-            "body": "본문",
-            "url": url,
-            "raw_hash": raw_hash,
-        }
-    )
-    if news_id is None:
-        raise RuntimeError("seed_signal failed: duplicate news")
-
-    event_ticker_id = db.insert_event_ticker(
-        news_id=int(news_id),
-        ticker="005930",
-        company_name="삼성전자",
-        confidence=0.98,
-        method="alias_dict",
-    )
 
-    signal_id = db.insert_signal(
-        {
-            "news_id": int(news_id),
-            "event_ticker_id": int(event_ticker_id),
-            "ticker": "005930",
-            "raw_score": 80,
-            "total_score": 80,
-            "components": json.dumps({"impact": 80}),
-            "priced_in_flag": "LOW",
-            "decision": "BUY",
-        }
+def create_open_position(
+    db: DB, ticker: str, signal_id: int | None, qty: float, avg_entry_price: float, opened_value: float
+) -> int:
+    """PENDING_ENTRY 단계를 건너뛴 OPEN 포지션 픽스처 (전이 검증이 필요 없는 조회 테스트용)."""
+    cur = db.conn.execute(
+        """
+        insert into positions(ticker,signal_id,status,qty,avg_entry_price,opened_value,high_watermark)
+        values(?,?, 'OPEN', ?, ?, ?, ?)
+        """,
+        (ticker, signal_id, qty, avg_entry_price, opened_value, avg_entry_price),
     )
+    return cur.lastrowid
+
+
+def seed_signal(db: DB, *, url: str, raw_hash: str, title: str = "삼성전자 테스트") -> tuple[int, int, int]:
+    # 뉴스 -> 티커 -> 신호는 id 의존 관계라 순차 insert 하되 커밋은 1회
+    db.begin()
+    try:
+        news_id = db.insert_news_if_new(
+            {
+                "source": "test",
+                "tier": 2,
+                "published_at": "2026-01-01T00:00:00+00:00",
+                "title": title,
+                "body": "본문",
+                "url": url,
+                "raw_hash": raw_hash,
+            },
+            autocommit=False,
+        )
+        if news_id is None:
+            raise RuntimeError("seed_signal failed: duplicate news")
+
+        event_ticker_id = db.insert_event_ticker(
+            news_id=int(news_id),
+            ticker="005930",
+            company_name="삼성전자",
+            confidence=0.98,
+            method="alias_dict",
+            autocommit=False,
+        )
+
+        signal_id = db.insert_signal(
+            {
+                "news_id": int(news_id),
+                "event_ticker_id": int(event_ticker_id),
+                "ticker": "005930",
+                "raw_score": 80,
+                "total_score": 80,
+                "components": DB.dumps_json({"impact": 80}),
+                "priced_in_flag": "LOW",
+                "decision": "BUY",
+            },
+            autocommit=False,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     return int(news_id), int(event_ticker_id), int(signal_id)
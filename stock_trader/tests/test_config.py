@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app import config
+
+
+class TestEnvFileCache(unittest.TestCase):
+    # 임시 디렉터리는 클래스당 1개, .env 파일은 테스트마다 다른 이름으로 생성
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        self.env_path = Path(self.tmpdir.name) / f"{self._testMethodName}.env"
+        config._ENV_CACHE.pop(self.env_path, None)
+
+    def tearDown(self) -> None:
+        config._ENV_CACHE.pop(self.env_path, None)
+        os.environ.pop("ST_TEST_ENV_KEY", None)
+
+    def test_parse_sets_env_and_reuses_cache(self) -> None:
+        self.env_path.write_text('# comment\nST_TEST_ENV_KEY="abc"\n', encoding="utf-8")
+        config._parse_env_file(self.env_path)
+        self.assertEqual(os.environ.get("ST_TEST_ENV_KEY"), "abc")
+
+        with patch("app.config._read_env_file") as read_mock:
+            config._parse_env_file(self.env_path)
+        read_mock.assert_not_called()
+
+    def test_changed_file_is_reparsed(self) -> None:
+        self.env_path.write_text("ST_TEST_ENV_KEY=one\n", encoding="utf-8")
+        config._parse_env_file(self.env_path)
+        os.environ.pop("ST_TEST_ENV_KEY", None)
+
+        self.env_path.write_text("ST_TEST_ENV_KEY=second\n", encoding="utf-8")
+        config._parse_env_file(self.env_path)
+        self.assertEqual(os.environ.get("ST_TEST_ENV_KEY"), "second")
+
+    def test_read_env_file_first_occurrence_and_quotes(self) -> None:
+        self.env_path.write_text(
+            "\n# A=commented\n  A = 'one' \r\nnoequals\nB=\"x=y\"\nA=two\n=orphan\n",
+            encoding="utf-8",
+        )
+        self.assertEqual(config._read_env_file(self.env_path), {"A": "one", "B": "x=y"})
+
+    def test_missing_file_is_noop(self) -> None:
+        config._parse_env_file(Path(self.tmpdir.name) / "missing.env")
+        self.assertNotIn(Path(self.tmpdir.name) / "missing.env", config._ENV_CACHE)
+
+
+class TestLazySettings(unittest.TestCase):
+    def test_field_read_on_first_access_and_cleared_by_reload(self) -> None:
+        s = config.Settings()
+        with patch.dict(os.environ, {"MIN_MAP_CONFIDENCE": "0.5"}):
+            self.assertEqual(s.min_map_confidence, 0.5)
+        self.assertEqual(s.min_map_confidence, 0.5)
+
+        with patch.dict(os.environ, {"MIN_MAP_CONFIDENCE": "0.7"}):
+            s.reload()
+            self.assertEqual(s.min_map_confidence, 0.7)
+
+
+if __name__ == "__main__":
+    unittest.main()
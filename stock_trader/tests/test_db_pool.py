@@ -0,0 +1,57 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.storage.db_pool import DBPool
+
+
+class TestDBPool(unittest.TestCase):
+    # 임시 디렉터리는 클래스당 1개, DB 파일은 테스트마다 새로 생성
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        self.db_path = str(Path(self.tmpdir.name) / f"{self._testMethodName}.db")
+
+    def test_rw_connection_is_reused_and_ro_sees_commits(self) -> None:
+        with DBPool(self.db_path, ro_size=1) as pool:
+            with pool.rw() as db1:
+                db1.ensure_risk_state_today("2026-01-02")
+            with pool.rw() as db2:
+                self.assertIs(db1, db2)
+
+            with pool.ro() as ro1:
+                self.assertIsNotNone(ro1.get_risk_state("2026-01-02"))
+                with self.assertRaises(sqlite3.OperationalError):
+                    ro1.ensure_risk_state_today("2026-01-03")
+            with pool.ro() as ro2:
+                self.assertIs(ro1, ro2)
+            self.assertEqual(ro2.path, self.db_path)
+            self.assertEqual(ro2.path_obj, Path(self.db_path))
+
+    def test_rw_rolls_back_on_error(self) -> None:
+        with DBPool(self.db_path) as pool:
+            with self.assertRaises(RuntimeError):
+                with pool.rw() as db:
+                    db.begin()
+                    db.ensure_risk_state_today("2026-01-02", autocommit=False)
+                    db.begin()
+                    raise RuntimeError("boom")
+            with pool.rw() as db:
+                self.assertEqual(db._transaction_depth, 0)
+                self.assertIsNone(db.get_risk_state("2026-01-02"))
+
+    def test_memory_pool_shares_single_connection(self) -> None:
+        with DBPool(":memory:") as pool:
+            with pool.rw() as rw, pool.ro() as ro:
+                self.assertIs(rw, ro)
+
+
+if __name__ == "__main__":
+    unittest.main()
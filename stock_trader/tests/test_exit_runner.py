@@ -1,6 +1,4 @@
-import tempfile
 import unittest
-from pathlib import Path
 from unittest.mock import patch
 
 from app.storage.db import DB
@@ -9,14 +7,11 @@ from app.scheduler.exit_runner import run_exit_cycle
 
 class TestExitRunner(unittest.TestCase):
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmpdir.name) / "exit_runner.db"
-        self.db = DB(str(self.db_path))
+        self.db = DB(":memory:")
         self.db.init()
 
     def tearDown(self) -> None:
         self.db.close()
-        self.tmpdir.cleanup()
 
     def test_run_exit_cycle_returns_stage_counts(self):
         with patch("app.scheduler.exit_runner.sync_pending_entries", return_value=1), patch(
@@ -1,5 +1,10 @@
+import tempfile
+import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
+from app.config import settings
 from app.execution.kis_broker import KISBroker
 from app.execution.broker_base import OrderRequest
 
@@ -12,6 +17,17 @@ class TestKISBroker(unittest.TestCase):
         self.assertIn("checks", out)
         self.assertEqual(out["checks"].get("broker"), "kis")
 
+    def test_tr_id_order_lookup(self):
+        with patch.object(settings, "kis_mode", "paper"):
+            b = KISBroker()
+        self.assertEqual(b._tr_id_order("buy"), "VTTT0802U")
+        self.assertEqual(b._tr_id_order("SELL"), "VTTT0801U")
+        self.assertEqual(b._tr_id_order(""), "VTTT0801U")
+
+        with patch.object(settings, "kis_mode", "live"):
+            b = KISBroker()
+        self.assertEqual(b._tr_id_order("BUY"), "TTTC0802U")
+
     def test_send_order_maps_accept_response(self):
         b = KISBroker()
 
@@ -33,6 +49,20 @@ class TestKISBroker(unittest.TestCase):
         self.assertEqual(out.status, "REJECTED")
         self.assertEqual(out.filled_qty, 0)
 
+    def test_order_cash_parses_raw_body(self):
+        b = KISBroker()
+        b._auth_header = lambda: {"authorization": "Bearer X"}  # type: ignore[attr-defined]
+
+        class R:
+            ok = True
+            status_code = 200
+            content = '{"rt_cd":"0","msg1":"주문 전송 완료","output":{"ODNO":"777"}}'.encode("utf-8")
+
+        b.session.post = lambda *a, **k: R()  # type: ignore[method-assign]
+        out = b.send_order(OrderRequest(signal_id=1, ticker="005930", side="BUY", qty=1))
+        self.assertEqual(out.status, "SENT")
+        self.assertEqual(out.broker_order_id, "777")
+
     def test_inquire_order_filled_parse(self):
         b = KISBroker()
         b._auth_header = lambda: {"authorization": "Bearer X"}  # type: ignore[attr-defined]
@@ -116,5 +146,70 @@ class TestKISBroker(unittest.TestCase):
         self.assertEqual(px, 83500.0)
 
 
+class TestKISTokenCache(unittest.TestCase):
+    # 임시 디렉터리는 클래스당 1개, 토큰 캐시 파일은 테스트마다 다른 이름으로 생성
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        self.cache_path = Path(self.tmpdir.name) / f"{self._testMethodName}.json"
+        self.patches = [
+            patch.object(settings, "kis_token_cache_path", str(self.cache_path)),
+            patch.object(settings, "kis_app_key", "APPKEY"),
+            patch.object(settings, "kis_app_secret", "SECRET"),
+            patch.object(settings, "kis_account_no", "12345678-01"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self) -> None:
+        for p in reversed(self.patches):
+            p.stop()
+
+    def _token_response(self, token: str, expires_in: int = 86400):
+        class R:
+            ok = True
+            status_code = 200
+            text = "{}"
+
+            def json(self):
+                return {"access_token": token, "token_type": "Bearer", "expires_in": expires_in}
+
+        return R()
+
+    def test_issue_token_honors_expires_in_and_persists(self):
+        b = KISBroker()
+        b.session.post = lambda *a, **k: self._token_response("T1", expires_in=3600)  # type: ignore[method-assign]
+        self.assertEqual(b._auth_header(), {"authorization": "Bearer T1"})
+        self.assertAlmostEqual(b._token.expires_at, time.time() + 3600, delta=5)
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(self.cache_path.stat().st_mode & 0o777, 0o600)
+
+        # 새 프로세스(인스턴스)는 토큰 엔드포인트를 다시 호출하지 않는다
+        b2 = KISBroker()
+        b2.session.post = lambda *a, **k: self.fail("token endpoint should not be called")  # type: ignore[method-assign]
+        self.assertEqual(b2._auth_header(), {"authorization": "Bearer T1"})
+
+    def test_expired_token_is_reissued(self):
+        b = KISBroker()
+        b.session.post = lambda *a, **k: self._token_response("OLD", expires_in=10)  # type: ignore[method-assign]
+        b._auth_header()
+
+        b.session.post = lambda *a, **k: self._token_response("NEW")  # type: ignore[method-assign]
+        self.assertEqual(b._auth_header(), {"authorization": "Bearer NEW"})
+
+    def test_invalidate_token_drops_file_cache(self):
+        b = KISBroker()
+        b.session.post = lambda *a, **k: self._token_response("T1")  # type: ignore[method-assign]
+        b._auth_header()
+        b._invalidate_token()
+        self.assertFalse(self.cache_path.exists())
+
+
 if __name__ == "__main__":
     unittest.main()
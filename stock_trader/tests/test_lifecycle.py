@@ -1,22 +1,20 @@
 import json
+import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
 
-from app.storage.db import DB
-from tests.helpers import seed_signal
+from app.storage.db import DB, IllegalTransitionError
+from tests.helpers import create_open_position, seed_signal
 
 
 class TestLifecycle(unittest.TestCase):
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmpdir.name) / "test.db"
-        self.db = DB(str(self.db_path))
+        self.db = DB(":memory:")
         self.db.init()
 
     def tearDown(self) -> None:
         self.db.close()
-        self.tmpdir.cleanup()
 
     def _seed_signal(self) -> tuple[int, int, int]:
         return seed_signal(self.db, url="https://example.com/t1", raw_hash="h1")
@@ -27,8 +25,8 @@ class TestLifecycle(unittest.TestCase):
         self.db.begin()
         try:
             position_id = self.db.create_position("005930", signal_id, qty=1.0, autocommit=False)
-            self.db.set_position_open(position_id, avg_entry_price=83500.0, opened_value=83500.0, autocommit=False)
-            self.db.set_position_closed(position_id, reason_code="TIME_EXIT", autocommit=False)
+            opened = self.db.set_position_open(position_id, avg_entry_price=83500.0, opened_value=83500.0, autocommit=False)
+            closed = self.db.set_position_closed(position_id, reason_code="TIME_EXIT", autocommit=False)
             self.db.commit()
         except Exception:
             self.db.rollback()
@@ -41,6 +39,54 @@ class TestLifecycle(unittest.TestCase):
         self.assertEqual(row[0], "CLOSED")
         self.assertEqual(float(row[1]), 83500.0)
         self.assertEqual(row[2], "TIME_EXIT")
+        self.assertEqual(opened["status"], "OPEN")
+        self.assertEqual(closed["status"], "CLOSED")
+        self.assertIsNotNone(closed["closed_at"])
+
+        with self.assertRaises(IllegalTransitionError):
+            self.db.set_position_closed(position_id, reason_code="TIME_EXIT")
+
+    def test_nested_failure_keeps_outer_transaction(self) -> None:
+        _, _, signal_id = self._seed_signal()
+        position_id = self.db.create_position("005930", signal_id, qty=1.0)
+        order_id = self.db.insert_order(position_id, signal_id, "005930", "BUY", 1.0, "MARKET", "SENT", None)
+
+        self.db.begin()
+        self.db.ensure_risk_state_today("2026-01-02", autocommit=False)
+        with self.assertRaises(IllegalTransitionError):
+            # 존재하지 않는 포지션: 내부 SAVEPOINT만 취소되고 외부 트랜잭션은 유지
+            self.db.record_entry_fill(position_id + 100, order_id, price=100.0, opened_value=100.0, detail_json="{}")
+        self.assertEqual(self.db._transaction_depth, 1)
+        self.assertTrue(self.db.conn.in_transaction)
+        self.assertEqual(self.db.get_order_status(order_id), "SENT")
+        self.db.commit()
+
+        self.assertFalse(self.db.conn.in_transaction)
+        self.assertIsNotNone(self.db.get_risk_state("2026-01-02"))
+
+    def test_apply_realized_pnl_honors_autocommit_false(self) -> None:
+        self.db.apply_realized_pnl("2026-01-02", -10.0, autocommit=False)
+        self.assertTrue(self.db.conn.in_transaction)
+        self.db.rollback()
+        self.assertIsNone(self.db.get_risk_state("2026-01-02"))
+
+        self.db.apply_realized_pnl("2026-01-02", -10.0)
+        self.assertFalse(self.db.conn.in_transaction)
+        self.assertEqual(self.db.get_risk_state("2026-01-02")["daily_realized_pnl"], -10.0)
+
+    def test_open_position_stats_matches_single_queries(self) -> None:
+        _, _, signal_id = self._seed_signal()
+        self.assertEqual(self.db.get_open_position_stats("005930"), (0, 0.0))
+
+        create_open_position(self.db, "005930", signal_id, 1.0, avg_entry_price=100.0, opened_value=100.0)
+        create_open_position(self.db, "000660", signal_id, 2.0, avg_entry_price=50.0, opened_value=100.0)
+        self.db.create_position("005930", signal_id, qty=1.0)  # PENDING_ENTRY는 제외
+
+        stats = self.db.get_open_position_stats("005930")
+        self.assertEqual(stats, (2, 100.0))
+        self.assertEqual(
+            stats, (self.db.count_open_positions(), self.db.get_open_exposure_for_ticker("005930"))
+        )
 
     def test_idempotency_collision_returns_none(self) -> None:
         _, _, signal_id = self._seed_signal()
@@ -52,7 +98,7 @@ class TestLifecycle(unittest.TestCase):
             event_type="ENTRY",
             action="EXECUTED",
             reason_code="ENTRY_FILLED",
-            detail_json=json.dumps({"ok": True}),
+            detail_json=DB.dumps_json({"ok": True}),
             idempotency_key=key,
         )
         second_id = self.db.insert_position_event(
@@ -60,13 +106,178 @@ class TestLifecycle(unittest.TestCase):
             event_type="ENTRY",
             action="EXECUTED",
             reason_code="ENTRY_FILLED_DUP",
-            detail_json=json.dumps({"dup": True}),
+            detail_json=DB.dumps_json({"dup": True}),
             idempotency_key=key,
         )
 
         self.assertIsNotNone(first_id)
         self.assertIsNone(second_id)
 
+        raw_type, raw = self.db.conn.execute(
+            "select typeof(detail_json), detail_json from position_events where id=?", (first_id,)
+        ).fetchone()
+        self.assertEqual(raw_type, "blob")
+        self.assertEqual(DB.loads_json(raw), {"ok": True})
+
+    def test_event_batch_flushes_once_and_skips_duplicate_keys(self) -> None:
+        _, _, signal_id = self._seed_signal()
+        position_id = self.db.create_position("005930", signal_id, qty=1.0)
+        self.db.insert_position_event(position_id, "ENTRY", "EXECUTED", "ENTRY_FILLED", "{}", idempotency_key="k1")
+
+        with self.db.begin_event_batch() as batch:
+            batch.append((position_id, "ENTRY", "EXECUTED", "ENTRY_FILLED_DUP", "{}", "k1"))
+            batch.append((position_id, "PARTIAL_EXIT", "EXECUTED", "PARTIAL_EXIT_FILLED", "{}", "k2"))
+            batch.append((position_id, "BLOCK", "BLOCKED", "NO_KEY", "{}", None))
+            self.assertEqual(
+                self.db.conn.execute("select count(*) from position_events").fetchone()[0], 1
+            )
+
+        reasons = [r[0] for r in self.db.conn.execute("select reason_code from position_events order by id")]
+        self.assertEqual(reasons, ["ENTRY_FILLED", "PARTIAL_EXIT_FILLED", "NO_KEY"])
+
+        with self.assertRaises(RuntimeError):
+            with self.db.begin_event_batch() as batch:
+                batch.append((position_id, "BLOCK", "BLOCKED", "DISCARDED", "{}", None))
+                raise RuntimeError("boom")
+        self.assertEqual(self.db.conn.execute("select count(*) from position_events").fetchone()[0], 3)
+
+        # 호출자 트랜잭션 안에서 실패하면 예외만 올리고 외부 트랜잭션은 그대로 둔다
+        self.db.begin()
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.db.begin_event_batch() as batch:
+                batch.append((position_id, "NOT_A_TYPE", "EXECUTED", "BAD", "{}", None))
+        self.assertEqual(self.db._transaction_depth, 1)
+        self.assertTrue(self.db.conn.in_transaction)
+        self.db.rollback()
+
+    def test_news_exists_short_circuits_duplicates(self) -> None:
+        self._seed_signal()
+        self.assertTrue(self.db.news_exists("https://example.com/t1", "other-hash"))
+        self.assertTrue(self.db.news_exists(None, "h1"))
+        self.assertFalse(self.db.news_exists("https://example.com/t2", "h2"))
+
+        item = {
+            "source": "test",
+            "tier": 2,
+            "published_at": "2026-01-01T00:00:00+00:00",
+            "title": "dup",
+            "body": "",
+            "url": "https://example.com/t1",
+            "raw_hash": "h-new",
+        }
+        self.assertIsNone(self.db.insert_news_if_new(item))
+
+    def test_insert_signals_many(self) -> None:
+        news_id, event_ticker_id, _ = self._seed_signal()
+        payloads = [
+            {
+                "news_id": news_id,
+                "event_ticker_id": event_ticker_id,
+                "ticker": "005930",
+                "raw_score": score,
+                "total_score": score,
+                "components": "{}",
+                "priced_in_flag": "LOW",
+                "decision": "HOLD",
+            }
+            for score in (50, 60, 70)
+        ]
+        self.assertEqual(self.db.insert_signals_many(payloads), 3)
+        cnt = self.db.conn.execute("select count(*) from signal_scores").fetchone()[0]
+        self.assertEqual(cnt, 4)
+
+    def test_record_entry_fill_and_filled_exit_order(self) -> None:
+        _, _, signal_id = self._seed_signal()
+        position_id = self.db.create_position("005930", signal_id, qty=2.0)
+        order_id = self.db.insert_order(position_id, signal_id, "005930", "BUY", 2.0, "MARKET", "SENT", None)
+
+        key = f"entry:{position_id}:{order_id}"
+        event_id = self.db.record_entry_fill(
+            position_id, order_id, price=100.0, opened_value=200.0, detail_json="{}", idempotency_key=key
+        )
+        self.assertIsNotNone(event_id)
+        self.assertEqual(self.db.get_order_status(order_id), "FILLED")
+        row = self.db.conn.execute(
+            "select status, avg_entry_price, high_watermark from positions where position_id=?", (position_id,)
+        ).fetchone()
+        self.assertEqual(tuple(row), ("OPEN", 100.0, 100.0))
+
+        # 이미 OPEN이면 재적용 불가
+        with self.assertRaises(IllegalTransitionError):
+            self.db.record_entry_fill(position_id, order_id, price=100.0, opened_value=200.0, detail_json="{}")
+
+        exit_order_id = self.db.insert_filled_order(position_id, signal_id, "005930", "SELL", 2.0, "MARKET", price=101.0)
+        order = self.db.get_order(exit_order_id)
+        self.assertEqual(order["status"], "FILLED")
+        self.assertEqual(order["filled_qty"], 2.0)
+        self.assertIsNotNone(order["filled_at"])
+
+
+class TestParameterCache(unittest.TestCase):
+    # 파일 DB가 필요한 테스트: 임시 디렉터리는 클래스당 1개, DB 파일은 테스트마다 새로 생성
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        self.db_path = str(Path(self.tmpdir.name) / f"{self._testMethodName}.db")
+        self.db = DB(self.db_path)
+        self.db.init()
+
+    def tearDown(self) -> None:
+        self.db.close()
+
+    def test_parameter_cached_until_refreshed_after_other_connection_commits(self) -> None:
+        self.db.refresh_parameter_cache()
+        first = self.db.get_parameter("retry_policy")
+        self.assertIs(self.db.get_parameter("retry_policy"), first)
+
+        with DB(self.db_path) as other:
+            other.conn.execute(
+                "update parameter_registry set value_json=? where name='retry_policy'",
+                (json.dumps({"max_attempts_per_signal": 5, "min_retry_interval_sec": 10}),),
+            )
+            other.conn.commit()
+
+        # 조회는 캐시만 보고, 주기별 refresh에서만 다른 연결의 커밋을 반영
+        self.assertIs(self.db.get_parameter("retry_policy"), first)
+        self.db.refresh_parameter_cache()
+        self.assertEqual(self.db.get_retry_policy()["max_attempts_per_signal"], 5)
+
+    def test_set_parameter_invalidates_own_cache(self) -> None:
+        self.assertEqual(self.db.get_retry_policy()["max_attempts_per_signal"], 2)
+        self.db.set_parameter("retry_policy", {"max_attempts_per_signal": 9, "min_retry_interval_sec": 10})
+        self.assertEqual(self.db.get_retry_policy()["max_attempts_per_signal"], 9)
+
+        with DB(self.db_path) as other:
+            self.assertEqual(other.get_retry_policy()["max_attempts_per_signal"], 9)
+
+    def test_rollback_drops_parameters_cached_in_transaction(self) -> None:
+        original = self.db.get_parameter("exit_policy")
+        self.db.begin()
+        self.db.set_parameter("exit_policy", {"v": 2}, autocommit=False)
+        self.assertEqual(self.db.get_parameter("exit_policy"), {"v": 2})
+        self.db.rollback()
+        self.assertEqual(self.db.get_parameter("exit_policy"), original)
+
+    def test_begin_takes_write_lock_immediately(self) -> None:
+        self.db.begin()
+        try:
+            self.assertTrue(self.db.conn.in_transaction)
+            other = sqlite3.connect(self.db_path, timeout=0, isolation_level=None)
+            try:
+                with self.assertRaises(sqlite3.OperationalError):
+                    other.execute("BEGIN IMMEDIATE")
+            finally:
+                other.close()
+        finally:
+            self.db.rollback()
+        self.assertFalse(self.db.conn.in_transaction)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,13 +13,31 @@ class TestLoopRunner(unittest.TestCase):
             raise KeyboardInterrupt()
 
         with patch("app.scheduler.loop_runner.run_exit_cycle", return_value={"ok": 1}), patch(
-            "app.scheduler.loop_runner.DB"
-        ) as db_mock, patch("app.scheduler.loop_runner.time.sleep", side_effect=fake_sleep):
+            "app.scheduler.loop_runner.DBPool"
+        ) as pool_mock, patch("app.scheduler.loop_runner.time.sleep", side_effect=fake_sleep):
             with self.assertRaises(KeyboardInterrupt):
                 run_exit_loop(interval_sec=1)
 
         self.assertEqual(calls["sleep"], 1)
-        self.assertTrue(db_mock.called)
+        self.assertTrue(pool_mock.called)
+        pool_mock.return_value.close.assert_called_once()
+
+    def test_run_exit_loop_reuses_pool_across_ticks(self):
+        calls = {"sleep": 0}
+
+        def fake_sleep(_):
+            calls["sleep"] += 1
+            if calls["sleep"] >= 3:
+                raise KeyboardInterrupt()
+
+        with patch("app.scheduler.loop_runner.run_exit_cycle", return_value={"ok": 1}) as cycle_mock, patch(
+            "app.scheduler.loop_runner.DBPool"
+        ) as pool_mock, patch("app.scheduler.loop_runner.time.sleep", side_effect=fake_sleep):
+            with self.assertRaises(KeyboardInterrupt):
+                run_exit_loop(interval_sec=1)
+
+        self.assertEqual(cycle_mock.call_count, 3)
+        self.assertEqual(pool_mock.call_count, 1)
 
 
 if __name__ == "__main__":
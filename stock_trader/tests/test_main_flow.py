@@ -1,35 +1,48 @@
-import tempfile
 import unittest
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import patch
 
 from app.main import (
     ingest_and_create_signal,
     execute_signal,
+    execute_signals,
     sync_pending_entries,
     sync_pending_exits,
     trigger_time_exit_orders,
     trigger_trailing_stop_orders,
     trigger_opposite_signal_exit_orders,
+    _build_broker,
     _collect_current_prices,
+    reset_broker,
 )
 from app.storage.db import DB, IllegalTransitionError
 from app.risk.engine import kill_switch
 from app.execution.broker_base import OrderResult
+from tests.helpers import reset_tables
 
 
 class TestMainFlow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.db = DB(":memory:")
+        cls.db.init()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.db.close()
+
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmpdir.name) / "main_flow.db"
-        self.db = DB(str(self.db_path))
-        self.db.init()
+        reset_broker()
+        reset_tables(self.db)
 
     def tearDown(self) -> None:
         kill_switch.off()
-        self.db.close()
-        self.tmpdir.cleanup()
+
+    def test_build_broker_reuses_instance_until_reset(self) -> None:
+        first = _build_broker()
+        self.assertIs(_build_broker(), first)
+        reset_broker()
+        self.assertIsNot(_build_broker(), first)
 
     def test_ingest_and_create_signal_success_then_duplicate(self) -> None:
         first = ingest_and_create_signal(self.db)
@@ -58,6 +71,17 @@ class TestMainFlow(unittest.TestCase):
         order_count = cur.fetchone()[0]
         self.assertEqual(order_count, 1)  # BUY only
 
+    def test_execute_signals_runs_each_bundle(self) -> None:
+        bundle = ingest_and_create_signal(self.db)
+        self.assertIsNotNone(bundle)
+
+        statuses = execute_signals(self.db, [bundle], qty=1.0)
+        self.assertEqual(statuses, ["FILLED"])
+
+        cur = self.db.conn.cursor()
+        cur.execute("select count(*) from positions where signal_id=? and status='OPEN'", (bundle["signal_id"],))
+        self.assertEqual(cur.fetchone()[0], 1)
+
     def test_execute_signal_success_path_with_demo_auto_close(self) -> None:
         bundle = ingest_and_create_signal(self.db)
         self.assertIsNotNone(bundle)
@@ -299,6 +323,8 @@ class TestMainFlow(unittest.TestCase):
         row = cur.fetchone()
         self.assertEqual(row[0], "FILLED")
         self.assertAlmostEqual(float(row[1]), 1.0)
+        cur.execute("select event_type, reason_code from position_events where event_type in ('ADD','ENTRY') order by id")
+        self.assertEqual([tuple(r) for r in cur.fetchall()], [("ADD", "PARTIAL_FILLED"), ("ENTRY", "ENTRY_FILLED")])
 
     def test_retry_blocked_same_condition_reason(self) -> None:
         bundle = ingest_and_create_signal(self.db)
@@ -1,7 +1,9 @@
 import unittest
 from unittest.mock import patch
 
-from app.ingestion.news_feed import fetch_rss_news, fetch_rss_news_items, NewsFetchError
+from datetime import datetime, timezone
+
+from app.ingestion.news_feed import NewsItem, build_hash, fetch_rss_news, fetch_rss_news_items, NewsFetchError
 
 
 class TestNewsFeed(unittest.TestCase):
@@ -62,6 +64,14 @@ class TestNewsFeed(unittest.TestCase):
             with self.assertRaises(NewsFetchError):
                 fetch_rss_news("https://example.com/rss")
 
+    def test_build_hash_is_stable_and_field_sensitive(self):
+        a = NewsItem(source="rss", tier=2, title="제목", body="", url="https://example.com/a", published_at=datetime.now(timezone.utc))
+        b = NewsItem(source="rss", tier=2, title="제목", body="다른 본문", url="https://example.com/a", published_at=datetime.now(timezone.utc))
+        c = NewsItem(source="rss", tier=2, title="제목2", body="", url="https://example.com/a", published_at=datetime.now(timezone.utc))
+        self.assertEqual(build_hash(a), build_hash(b))
+        self.assertNotEqual(build_hash(a), build_hash(c))
+        self.assertEqual(len(build_hash(a)), 32)
+
 
 if __name__ == "__main__":
     unittest.main()
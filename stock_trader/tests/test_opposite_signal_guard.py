@@ -1,6 +1,4 @@
-import tempfile
 import unittest
-from pathlib import Path
 from unittest.mock import Mock
 
 from app.main import trigger_opposite_signal_exit_orders
@@ -10,14 +8,11 @@ from tests.helpers import seed_signal
 
 class TestOppositeSignalGuard(unittest.TestCase):
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmpdir.name) / "opposite_guard.db"
-        self.db = DB(str(self.db_path))
+        self.db = DB(":memory:")
         self.db.init()
 
     def tearDown(self) -> None:
         self.db.close()
-        self.tmpdir.cleanup()
 
     def test_skip_when_latest_signal_is_entry_signal(self) -> None:
         _, _, signal_id = seed_signal(self.db, url="https://example.com/oppo", raw_hash="oppo-h1")
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 from app.execution.broker_base import OrderRequest
 from app.execution.paper_broker import PaperBroker
@@ -17,6 +18,21 @@ class TestPaperBroker(unittest.TestCase):
         self.assertEqual(q.status, "FILLED")
         self.assertEqual(q.avg_price, 83000.0)
 
+    def test_send_orders_batch_without_latency(self):
+        broker = PaperBroker(simulate_latency=False)
+        reqs = [
+            OrderRequest(signal_id=i, ticker="005930", side="BUY", qty=1, expected_price=83000.0 + i)
+            for i in range(5)
+        ]
+        with patch("app.execution.paper_broker.time.sleep") as sleep_mock:
+            results = broker.send_orders(reqs)
+        sleep_mock.assert_not_called()
+
+        self.assertEqual([r.avg_price for r in results], [83000.0 + i for i in range(5)])
+        ids = [r.broker_order_id for r in results]
+        self.assertEqual(len(set(ids)), 5)
+        self.assertEqual(broker.inquire_order(ids[-1], ticker="005930").avg_price, 83004.0)
+
 
 if __name__ == "__main__":
     unittest.main()
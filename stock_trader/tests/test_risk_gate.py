@@ -1,26 +1,28 @@
-import tempfile
 import unittest
 from datetime import datetime
-from pathlib import Path
 
 from app.execution.broker_base import OrderRequest
 from app.execution.paper_broker import PaperBroker
 from app.risk.engine import can_trade, kill_switch
 from app.storage.db import DB
-from tests.helpers import seed_signal
+from tests.helpers import reset_tables, seed_signal
 
 
 class TestRiskGate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.db = DB(":memory:")
+        cls.db.init()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.db.close()
+
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.db_path = Path(self.tmpdir.name) / "risk_test.db"
-        self.db = DB(str(self.db_path))
-        self.db.init()
+        reset_tables(self.db)
 
     def tearDown(self) -> None:
         kill_switch.off()
-        self.db.close()
-        self.tmpdir.cleanup()
 
     def _seed_signal(self) -> int:
         _, _, signal_id = seed_signal(self.db, url="https://example.com/risk", raw_hash="risk-h1")
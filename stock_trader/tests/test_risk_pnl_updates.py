@@ -1,19 +1,15 @@
-import tempfile
 import unittest
-from pathlib import Path
 
 from app.storage.db import DB
 
 
 class TestRiskPnlUpdates(unittest.TestCase):
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.db = DB(str(Path(self.tmpdir.name) / "pnl.db"))
+        self.db = DB(":memory:")
         self.db.init()
 
     def tearDown(self) -> None:
         self.db.close()
-        self.tmpdir.cleanup()
 
     def test_apply_realized_pnl_updates_daily_and_streak(self):
         d = "2026-03-02"
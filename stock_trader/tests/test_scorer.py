@@ -0,0 +1,34 @@
+import unittest
+
+from app.signal.scorer import ScoreInput, compute_scores, compute_scores_batch
+
+
+class TestScorer(unittest.TestCase):
+    def _inp(self, impact: float = 80.0, risk_penalty: float = 0.0) -> ScoreInput:
+        return ScoreInput(
+            impact=impact,
+            source_reliability=70.0,
+            novelty=60.0,
+            market_reaction=50.0,
+            liquidity=40.0,
+            risk_penalty=risk_penalty,
+        )
+
+    def test_default_weights(self):
+        raw, total = compute_scores(self._inp())
+        self.assertAlmostEqual(raw, 0.30 * 80 + 0.20 * 70 + 0.20 * 60 + 0.15 * 50 + 0.15 * 40)
+        self.assertEqual(raw, total)
+
+    def test_partial_weights_override_defaults_and_clamp(self):
+        raw, total = compute_scores(self._inp(risk_penalty=200.0), weights={"impact": 1.0})
+        self.assertAlmostEqual(raw, 1.0 * 80 + 0.20 * 70 + 0.20 * 60 + 0.15 * 50 + 0.15 * 40 - 200.0)
+        self.assertEqual(total, 0.0)
+
+    def test_batch_matches_single(self):
+        inputs = [self._inp(impact=i * 10.0, risk_penalty=i) for i in range(5)]
+        weights = {"novelty": 0.5}
+        self.assertEqual(compute_scores_batch(inputs, weights), [compute_scores(x, weights) for x in inputs])
+
+
+if __name__ == "__main__":
+    unittest.main()
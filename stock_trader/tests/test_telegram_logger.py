@@ -0,0 +1,25 @@
+import unittest
+from unittest.mock import patch
+
+from app.monitor import telegram_logger
+
+
+class TestTelegramNotifyFlag(unittest.TestCase):
+    def tearDown(self) -> None:
+        telegram_logger.set_notify_enabled(False)
+
+    def test_disabled_under_unittest(self):
+        self.assertFalse(telegram_logger._NOTIFY_ENABLED)
+        with patch.object(telegram_logger._telegram_queue, "add") as add_mock:
+            self.assertFalse(telegram_logger.send_telegram("hello"))
+        add_mock.assert_not_called()
+
+    def test_set_notify_enabled_queues_message(self):
+        telegram_logger.set_notify_enabled(True)
+        with patch.object(telegram_logger._telegram_queue, "add") as add_mock:
+            self.assertTrue(telegram_logger.send_telegram("hello", priority=1))
+        add_mock.assert_called_once_with("hello", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
-from app.nlp.ticker_mapper import map_ticker
+from app.nlp import ticker_mapper
+from app.nlp.ticker_mapper import map_ticker, map_tickers_batch
 
 
 class TestTickerMapper(unittest.TestCase):
@@ -11,6 +12,26 @@ class TestTickerMapper(unittest.TestCase):
     def test_ambiguous_returns_none(self):
         self.assertIsNone(map_ticker("삼성 관련 뉴스"))
 
+    def test_longest_alias_wins(self):
+        res = map_ticker("SK하이닉스 실적 발표")
+        self.assertEqual(res.ticker, "000660")
+        self.assertEqual(res.method, "exact_match")
+
+    def test_regex_fallback_matches_automaton(self):
+        text = "삼성 바이오로직스와 SK hynix 동반 상승"
+        automaton = ticker_mapper._AUTOMATON
+        try:
+            ticker_mapper._AUTOMATON = None
+            fallback = map_ticker(text)
+        finally:
+            ticker_mapper._AUTOMATON = automaton
+        self.assertEqual(fallback, map_ticker(text))
+        self.assertEqual(fallback.ticker, "000660")
+
+    def test_batch_matches_single_calls(self):
+        texts = ["현대차 투자 확대", "", "삼성 관련 뉴스", "SK hynix capex", "코드 005930 공시", "SK하이닉스"]
+        self.assertEqual(map_tickers_batch(texts), [map_ticker(t) for t in texts])
+
 
 if __name__ == "__main__":
     unittest.main()